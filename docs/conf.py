@@ -3,13 +3,11 @@
 from __future__ import annotations
 
 import datetime
-import os
 import pathlib
-import sys
+from importlib import metadata
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
-sys.path.insert(0, str(SRC))
 
 project = "libusb-uvc"
 author = "Libusb-UVC Contributors"
@@ -17,41 +15,38 @@ current_year = datetime.datetime.now().year
 copyright = f"{current_year}, {author}"
 
 try:
-    from libusb_uvc import __version__ as release
-except Exception:  # pragma: no cover - fallback when package unavailable
+    release = metadata.version(project)
+except metadata.PackageNotFoundError:  # pragma: no cover - fallback when package unavailable
     release = "0.0.0"
 
 extensions = [
-    "sphinx.ext.autodoc",
-    "sphinx.ext.autosummary",
+    "autoapi.extension",
     "sphinx.ext.napoleon",
     "sphinx.ext.intersphinx",
     "sphinx.ext.viewcode",
 ]
 
-autosummary_generate = True
-autodoc_member_order = "bysource"
-autodoc_default_options = {
-    "show-inheritance": True,
-    "members": True,
-    "undoc-members": False,
-}
+# sphinx-autoapi parses the sources statically, so building the docs never
+# imports libusb_uvc or its native dependencies (pyusb, libusb1, OpenCV, ...).
+autoapi_type = "python"
+autoapi_dirs = [str(SRC / "libusb_uvc")]
+autoapi_add_toctree_entry = False
+autoapi_member_order = "bysource"
+autoapi_options = [
+    "members",
+    "show-inheritance",
+]
 
 napoleon_google_docstring = True
 napoleon_numpy_docstring = False
 
-autodoc_mock_imports = [
-    "usb",
-    "usb1",
-    "cv2",
-    "numpy",
-    "PIL",
-    "gi",
-]
-
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3", None),
 }
+# Keep offline or slow-network builds from stalling on the inventory fetch and
+# reuse a cached inventory for incremental builds.
+intersphinx_timeout = 5
+intersphinx_cache_limit = 90
 
 templates_path = ["_templates"]
 exclude_patterns = ["_build"]
@@ -59,3 +54,25 @@ exclude_patterns = ["_build"]
 html_theme = "sphinx_rtd_theme"
 html_static_path = ["_static"]
 html_logo = '_static/logo.svg'
+
+
+def _resolve_reexported_reference(app, env, node, contnode):
+    """Point ``libusb_uvc.X`` references at ``libusb_uvc.core.X``.
+
+    The package re-exports :mod:`libusb_uvc.core` at runtime, which static
+    parsing cannot see, so the generated objects only exist under ``core``.
+    """
+
+    target = node.get("reftarget", "")
+    if node.get("refdomain") != "py" or not target.startswith("libusb_uvc."):
+        return None
+    if target.startswith("libusb_uvc.core."):
+        return None
+    core_target = "libusb_uvc.core." + target[len("libusb_uvc."):]
+    return env.get_domain("py").resolve_xref(
+        env, node["refdoc"], app.builder, node["reftype"], core_target, node, contnode
+    )
+
+
+def setup(app):
+    app.connect("missing-reference", _resolve_reexported_reference)
@@ -6,10 +6,14 @@ from __future__ import annotations
 import argparse
 import logging
 import pathlib
+import queue
 import sys
-from typing import List, Optional
+import threading
+import time
+from typing import List, Optional, Tuple
 
 import cv2
+import numpy as np
 import usb.core
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -20,6 +24,8 @@ except ImportError:  # pragma: no cover
     from libusb_uvc import CodecPreference, ControlEntry, UVCCamera, UVCError, describe_device
 
 LOG = logging.getLogger("exposure_sweep")
+# cv2.pollKey (OpenCV >= 4.5) pumps GUI events without waitKey's 1 ms sleep.
+_poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
 
 
 def find_control(entries: List[ControlEntry], *names: str) -> Optional[ControlEntry]:
@@ -38,18 +44,27 @@ def build_exposure_sweep(ctrl: ControlEntry, frames: int) -> List[int]:
     if ctrl.minimum is None or ctrl.maximum is None:
         raise ValueError("Exposure control does not report min/max")
     step = ctrl.step or 1
-    span = ctrl.maximum - ctrl.minimum
-    steps = max(2, frames)
-    values: List[int] = []
-    for i in range(steps):
-        frac = i / (steps - 1)
-        raw = ctrl.minimum + span * frac
-        value = int(round(raw / step)) * step
-        value = max(ctrl.minimum, min(ctrl.maximum, value))
-        if values and value == values[-1]:
+    raw = np.linspace(ctrl.minimum, ctrl.maximum, max(2, frames))
+    quantized = (np.round(raw / step).astype(np.int64) * step).clip(ctrl.minimum, ctrl.maximum)
+    # The ramp is monotonic, so np.unique only removes repeated steps.
+    return np.unique(quantized).tolist()
+
+
+def _setter_worker(camera: UVCCamera, requests: queue.Queue, errors: List[Tuple[int, Exception]]) -> None:
+    """Apply queued ``(control, value, step)`` writes until a ``None`` sentinel arrives."""
+
+    while True:
+        item = requests.get()
+        if item is None:
+            return
+        if errors:
+            # Keep draining so producers never block on a dead worker.
             continue
-        values.append(value)
-    return values
+        ctrl, value, step = item
+        try:
+            camera.set_control(ctrl, value)
+        except (UVCError, usb.core.USBError) as exc:
+            errors.append((step, exc))
 
 
 def main() -> int:
@@ -88,21 +103,7 @@ def main() -> int:
                 "Exposure Auto",
                 "Exposure, Auto",
             )
-            if auto_ctrl and auto_ctrl.is_writable():
-                try:
-                    camera.set_control(auto_ctrl, 1)  # Manual Mode
-                    LOG.info("Set auto exposure mode to Manual (%s)", auto_ctrl.name)
-                except (UVCError, usb.core.USBError) as exc:
-                    LOG.warning("Failed to set auto exposure mode (%s)", exc)
-
             priority_ctrl = find_control(controls, "Exposure Auto Priority")
-            if priority_ctrl and priority_ctrl.is_writable():
-                try:
-                    camera.set_control(priority_ctrl, 0)
-                    LOG.info("Disabled exposure auto priority")
-                except (UVCError, usb.core.USBError) as exc:
-                    LOG.debug("Unable to clear exposure priority: %s", exc)
-
             exposure_ctrl = find_control(controls, "Exposure Time, Absolute")
             if not exposure_ctrl or not exposure_ctrl.is_writable():
                 print("Exposure control not available or not writable on this device.")
@@ -111,11 +112,6 @@ def main() -> int:
             sweep = build_exposure_sweep(exposure_ctrl, args.frames)
             LOG.info("Sweeping exposure from %s to %s in %d steps", sweep[0], sweep[-1], len(sweep))
             current_value = sweep[0]
-            try:
-                camera.set_control(exposure_ctrl, current_value)
-            except (UVCError, usb.core.USBError) as exc:
-                LOG.error("Unable to set initial exposure value: %s", exc)
-                return 1
 
             font = cv2.FONT_HERSHEY_SIMPLEX
             color = (0, 255, 0)
@@ -126,11 +122,26 @@ def main() -> int:
                 codec=CodecPreference.MJPEG,
                 frame_rate=None,
                 strict_fps=False,
-                skip_initial=10,
-                queue_size=4,
+                # Warm-up frames are discarded below once the exposure writes land.
+                skip_initial=0,
+                # FrameStream drops the oldest frame when full, so a single slot
+                # always hands us the newest frame for the current exposure step.
+                queue_size=1,
                 timeout_ms=2000,
             )
 
+            # Control writes run on a helper thread so the USB OUT transfer overlaps
+            # with decoding/display of the current frame.
+            setter_queue: queue.Queue = queue.Queue(maxsize=2)
+            setter_errors: List[Tuple[int, Exception]] = []
+            setter_thread = threading.Thread(
+                target=_setter_worker,
+                args=(camera, setter_queue, setter_errors),
+                name="exposure-setter",
+                daemon=True,
+            )
+            setter_thread.start()
+
             window = None
             try:
                 try:
@@ -140,56 +151,108 @@ def main() -> int:
                     LOG.warning("OpenCV window creation failed (%s); running headless", exc)
                     window = None
 
+                # Bind the per-frame callables once; the loop runs at camera rate.
+                put_text = cv2.putText
+                imshow = cv2.imshow
+                get_window_property = cv2.getWindowProperty
+                poll_key = _poll_key
+                log_info = LOG.info
+                line_aa = cv2.LINE_AA
+                total = len(sweep)
+
                 with stream as frames:
-                    next_index = 0
-                    measured_value: Optional[int] = current_value
-                    for idx, frame in enumerate(frames):
+                    # Configure exposure while the stream is already running so the
+                    # control transfers overlap with sensor start-up rather than
+                    # preceding a fixed number of skipped frames.
+                    if auto_ctrl and auto_ctrl.is_writable():
+                        try:
+                            camera.set_control(auto_ctrl, 1)  # Manual Mode
+                            LOG.info("Set auto exposure mode to Manual (%s)", auto_ctrl.name)
+                        except (UVCError, usb.core.USBError) as exc:
+                            LOG.warning("Failed to set auto exposure mode (%s)", exc)
+
+                    if priority_ctrl and priority_ctrl.is_writable():
                         try:
-                            readback = camera.get_control(exposure_ctrl)
-                            if isinstance(readback, int):
-                                measured_value = readback
+                            camera.set_control(priority_ctrl, 0)
+                            LOG.info("Disabled exposure auto priority")
                         except (UVCError, usb.core.USBError) as exc:
-                            LOG.debug("Exposure readback failed: %s", exc)
-                        value = measured_value if measured_value is not None else current_value
-                        millis = value / 10000.0 if isinstance(value, int) else None
+                            LOG.debug("Unable to clear exposure priority: %s", exc)
+
+                    try:
+                        camera.set_control(exposure_ctrl, current_value)
+                    except (UVCError, usb.core.USBError) as exc:
+                        LOG.error("Unable to set initial exposure value: %s", exc)
+                        return 1
+                    settled_at = time.time()
+                    # Frames completed before the write, plus the one in flight while
+                    # it landed, were exposed with the previous settings.
+                    settle_frames = 1
+
+                    next_index = 0
+                    verified = False
+                    for frame in frames:
+                        if frame.timestamp < settled_at:
+                            continue
+                        if settle_frames > 0:
+                            settle_frames -= 1
+                            continue
+                        # The sweep is the only writer of the exposure control, so the
+                        # value we last set is authoritative; read it back once only.
+                        if not verified:
+                            verified = True
+                            try:
+                                readback = camera.get_control(exposure_ctrl)
+                                if isinstance(readback, int) and readback != current_value:
+                                    LOG.warning(
+                                        "Exposure readback %s differs from requested %s",
+                                        readback,
+                                        current_value,
+                                    )
+                            except (UVCError, usb.core.USBError) as exc:
+                                LOG.debug("Exposure readback failed: %s", exc)
+                        value = current_value
+                        millis = value / 10000.0
+
+                        if window:
+                            try:
+                                visible = get_window_property(window, cv2.WND_PROP_VISIBLE) >= 1
+                            except cv2.error:
+                                visible = False
+                            if not visible:
+                                # Nobody is watching any more; stop decoding frames for it.
+                                LOG.info("Preview window closed; continuing headless")
+                                window = None
 
                         if window:
                             bgr = frame.to_bgr()
-                            label = (
-                                f"Exposure: {value} ({millis:.2f} ms)"
-                                if millis is not None
-                                else f"Exposure: {value}"
-                            )
-                            cv2.putText(bgr, label, (30, 50), font, 1.0, color, 2, cv2.LINE_AA)
-                            cv2.putText(
-                                bgr,
-                                f"Frame {idx + 1}/{len(sweep)}",
-                                (30, 100),
-                                font,
-                                0.9,
-                                color,
-                                2,
-                                cv2.LINE_AA,
-                            )
-                            cv2.imshow(window, bgr)
-                            key = cv2.waitKey(1) & 0xFF
+                            label = f"Exposure: {value} ({millis:.2f} ms)"
+                            put_text(bgr, label, (30, 50), font, 1.0, color, 2, line_aa)
+                            put_text(bgr, f"Frame {next_index + 1}/{total}", (30, 100), font, 0.9, color, 2, line_aa)
+                            imshow(window, bgr)
+                            key = poll_key() & 0xFF
                             if key in (ord("q"), 27):
                                 break
                         else:
-                            if millis is not None:
-                                LOG.info("Frame %d/%d exposure %.2f ms", idx + 1, len(sweep), millis)
+                            log_info("Frame %d/%d exposure %.2f ms", next_index + 1, total, millis)
 
-                        if next_index < len(sweep) - 1:
+                        if setter_errors:
+                            step, exc = setter_errors[0]
+                            LOG.warning("Failed to set exposure step %d: %s", step, exc)
+                            break
+                        if next_index < total - 1:
                             next_index += 1
                             current_value = sweep[next_index]
                             try:
-                                camera.set_control(exposure_ctrl, current_value)
-                            except (UVCError, usb.core.USBError) as exc:
-                                LOG.warning("Failed to set exposure step %d: %s", next_index, exc)
-                                break
+                                setter_queue.put_nowait((exposure_ctrl, current_value, next_index))
+                            except queue.Full:
+                                # The worker is still busy with earlier steps; block
+                                # rather than skipping a sweep value.
+                                setter_queue.put((exposure_ctrl, current_value, next_index))
                         else:
                             break
             finally:
+                setter_queue.put(None)
+                setter_thread.join(timeout=2.0)
                 if window:
                     cv2.destroyWindow(window)
                 if auto_ctrl and auto_ctrl.is_writable() and auto_ctrl.default is not None:
@@ -5,11 +5,21 @@ from __future__ import annotations
 
 import argparse
 import logging
+from io import BytesIO
 from pathlib import Path
 
 from PIL import Image
 
-from uvc_cli import add_device_arguments, apply_device_filters, configure_logging, ensure_repo_import, resolve_device_index
+from uvc_cli import (
+    CONVERTIBLE_SUFFIXES,
+    JPEG_SUFFIXES,
+    add_device_arguments,
+    apply_device_filters,
+    configure_logging,
+    ensure_repo_import,
+    resolve_device_index,
+    write_payload,
+)
 
 ensure_repo_import()
 from libusb_uvc import (
@@ -32,10 +42,23 @@ def save_frame(output_path: Path, payload: bytes, stream_format: StreamFormat, f
     output_suffix = output_path.suffix.lower()
 
     if stream_format.subtype == VS_FORMAT_MJPEG:
-        if output_suffix in {".jpg", ".jpeg"}:
-            output_path.write_bytes(payload)
+        if output_suffix in JPEG_SUFFIXES:
+            write_payload(output_path, payload)
             LOG.info("Saved MJPEG payload directly to %s", output_path)
             return
+        if output_suffix not in CONVERTIBLE_SUFFIXES:
+            write_payload(output_path, payload)
+            LOG.info("Saved MJPEG payload without conversion to %s", output_path)
+            return
+        try:
+            # Pillow decodes straight to RGB, avoiding the BGR round-trip through OpenCV.
+            with Image.open(BytesIO(payload)) as image:
+                image.load()
+                image.save(output_path)
+            LOG.info("Converted MJPEG payload to %s", output_suffix.upper())
+            return
+        except Exception as exc:
+            LOG.debug("Pillow could not convert MJPEG payload (%s); trying OpenCV", exc)
         try:
             import cv2
             import numpy as np
@@ -52,7 +75,7 @@ def save_frame(output_path: Path, payload: bytes, stream_format: StreamFormat, f
             LOG.warning("OpenCV unavailable; saving MJPEG payload as .raw")
         except Exception as exc:
             LOG.warning("MJPEG conversion failed (%s); saving raw payload", exc)
-        output_path.with_suffix(".raw").write_bytes(payload)
+        write_payload(output_path.with_suffix(".raw"), payload)
         return
 
     if stream_format.subtype == VS_FORMAT_UNCOMPRESSED:
@@ -61,12 +84,12 @@ def save_frame(output_path: Path, payload: bytes, stream_format: StreamFormat, f
             Image.fromarray(rgb).save(output_path)
             LOG.info("Converted uncompressed frame to %s", output_suffix.upper())
             return
-        output_path.write_bytes(payload)
+        write_payload(output_path, payload)
         LOG.info("Saved uncompressed payload as raw bytes")
         return
 
     LOG.warning("Unsupported format %s; saving raw payload", stream_format.description)
-    output_path.write_bytes(payload)
+    write_payload(output_path, payload)
 
 
 def main() -> int:
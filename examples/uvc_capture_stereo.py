@@ -6,15 +6,17 @@ from __future__ import annotations
 import argparse
 import contextlib
 import logging
+import os
 import queue
+import sys
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from numbers import Number
-from typing import Optional
+from typing import Deque, Dict, List, Optional, Tuple
 
 import numpy as np
-import psutil
 import usb.util
 
 try:  # Optional dependency for preview
@@ -22,13 +24,15 @@ try:  # Optional dependency for preview
 except Exception:  # pragma: no cover - OpenCV not always present
     cv2 = None
 
-from uvc_cli import ensure_repo_import, parse_device_id
+from uvc_cli import add_transfer_arguments, ensure_repo_import, parse_device_id
 
 ensure_repo_import()
 
 from libusb_uvc import (  # type: ignore  # pylint: disable=wrong-import-position
     CodecPreference,
     DecoderPreference,
+    GST_AVAILABLE,
+    MJPEGPreviewPipeline,
     UVCCamera,
     UVCError,
     describe_device,
@@ -37,13 +41,64 @@ from libusb_uvc import (  # type: ignore  # pylint: disable=wrong-import-positio
 
 LOG = logging.getLogger("stereo_preview_v3")
 PTS_TICK_HZ = 48_000_000.0
+PTS_TICK_SECONDS = 1.0 / PTS_TICK_HZ
+
+# (host_delta_ns, centered_delta_ns, left_pts, right_pts) for --print-deltas.
+DeltaRecord = Tuple[int, Optional[int], Optional[Number], Optional[Number]]
 
 
 @dataclass
 class FramePacket:
     frame: object
-    host_ts: float
+    host_ts_ns: int
     pts: Optional[float]
+    bgr: Optional[np.ndarray] = None
+
+
+class FrameRing:
+    """Bounded single-producer/single-consumer buffer that drops its oldest packet when full.
+
+    Backed by ``deque(maxlen=...)``: ``append`` and ``popleft`` are atomic, so a
+    packet is either fully published or not visible at all and neither side
+    takes a lock.  Pushes set *ready*, which may be shared between rings so one
+    consumer can sleep on all of them.
+    """
+
+    def __init__(self, capacity: int, ready: Optional[threading.Event] = None) -> None:
+        self._packets: Deque[FramePacket] = deque(maxlen=max(1, capacity))
+        self._ready = ready if ready is not None else threading.Event()
+
+    def push(self, packet: FramePacket) -> None:
+        self._packets.append(packet)
+        self._ready.set()
+
+    def get(self) -> Optional[FramePacket]:
+        """Return the oldest packet without blocking, or ``None`` when empty."""
+
+        packets = self._packets
+        return packets.popleft() if packets else None
+
+    def take_latest(self) -> Optional[FramePacket]:
+        """Return the newest packet and discard everything older.
+
+        Popping from the consumer end one packet at a time never removes a
+        packet the producer appends meanwhile; ``pop()`` followed by
+        ``clear()`` could discard a newer frame pushed between the two calls.
+        The cost is linear in the (bounded) backlog but raises no exceptions:
+        ``deque(maxlen=...)`` only evicts on append, so a non-empty ring cannot
+        be emptied under the consumer between the check and ``popleft()``.
+        """
+
+        packet = None
+        packets = self._packets
+        while packets:
+            packet = packets.popleft()
+        return packet
+
+    def clear(self) -> None:
+        """Discard every queued packet."""
+
+        self._packets.clear()
 
 
 def _normalise_codec(value: str) -> CodecPreference:
@@ -56,30 +111,47 @@ def _normalise_decoder(value: str) -> DecoderPreference:
     return getattr(DecoderPreference, token)
 
 
+# Serial strings keyed by (bus, address); each descriptor is read at most once.
+_SERIAL_CACHE: Dict[Tuple[object, object], Optional[str]] = {}
+
+
+def _device_serial(dev) -> Optional[str]:
+    key = (getattr(dev, "bus", None), getattr(dev, "address", None))
+    if key in _SERIAL_CACHE:
+        return _SERIAL_CACHE[key]
+    serial = None
+    try:
+        if dev.iSerialNumber:
+            serial = usb.util.get_string(dev, dev.iSerialNumber)
+    except Exception:
+        serial = None
+    _SERIAL_CACHE[key] = serial
+    return serial
+
+
 def _open_camera_filtered(vid: int, pid: int, serial: str, interface: int, label: str) -> UVCCamera:
     devices = find_uvc_devices(vid, pid)
     if not devices:
         raise UVCError(f"No cameras found for VID:PID {vid:04x}:{pid:04x}")
+    # Stop at the first match; the other camera's lookup reuses every serial
+    # already read here and only queries the devices that were not reached.
     for index, dev in enumerate(devices):
-        device_serial = None
-        try:
-            if dev.iSerialNumber:
-                device_serial = usb.util.get_string(dev, dev.iSerialNumber)
-        except Exception:
-            device_serial = None
-        if device_serial == serial:
+        if _device_serial(dev) == serial:
             return UVCCamera.open(vid=vid, pid=pid, device_index=index, interface=interface)
     raise UVCError(f"No camera with serial {serial} for VID:PID {vid:04x}:{pid:04x}")
 
 
-def _select_camera(args: argparse.Namespace, label: str) -> UVCCamera:
+def _select_camera(
+    args: argparse.Namespace,
+    label: str,
+    index: int,
+    serial: Optional[str],
+) -> UVCCamera:
     if args.device_id:
         vid, pid = args.device_id
-        serial = getattr(args, f"{label}_device_sn")
         if not serial:
             raise UVCError(f"--{label}-device-sn is required when --device-id is provided")
         return _open_camera_filtered(vid, pid, serial, args.interface, label)
-    index = getattr(args, f"{label}_index")
     return UVCCamera.open(device_index=index, interface=args.interface)
 
 
@@ -87,13 +159,13 @@ def _pts_to_seconds(value: Optional[Number]) -> Optional[float]:
     if value is None:
         return None
     if isinstance(value, (int, np.integer)):
-        return float(value) / PTS_TICK_HZ
+        return value * PTS_TICK_SECONDS
     return float(value)
 
 
 def frame_producer(
     camera: UVCCamera,
-    frame_queue: queue.Queue,
+    frame_ring: FrameRing,
     stop_event: threading.Event,
     start_barrier: threading.Barrier,
     start_event: threading.Event,
@@ -101,19 +173,33 @@ def frame_producer(
     label: str,
     core_id: Optional[int] = None,
     start_delay: float = 0.0,
+    rt_priority: Optional[int] = None,
+    decode_bgr: bool = False,
 ) -> None:
-    """Continuously capture frames and relay them to the consumer queue."""
+    """Continuously capture frames and relay them to the consumer ring.
+
+    With *decode_bgr* each packet also carries the frame converted to BGR.
+    """
 
-    proc = psutil.Process()
     original_affinity = None
     try:
+        # Affinity and scheduling policy are per thread (pid 0) on Linux and are
+        # inherited by the FrameStream poll thread started below.
         if core_id is not None:
             try:
-                original_affinity = proc.cpu_affinity()
-                proc.cpu_affinity([core_id])
+                original_affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {core_id})
                 LOG.info("%s pinned to CPU core %s", label, core_id)
-            except (psutil.Error, ValueError) as exc:
+            except (AttributeError, OSError, ValueError) as exc:
                 LOG.warning("Failed to set affinity for %s: %s", label, exc)
+        if rt_priority is not None:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(rt_priority))
+                LOG.info("%s running with SCHED_FIFO priority %s", label, rt_priority)
+            except PermissionError:
+                LOG.warning("SCHED_FIFO for %s needs CAP_SYS_NICE (or launch via chrt)", label)
+            except (AttributeError, OSError, ValueError) as exc:
+                LOG.warning("Failed to set real-time scheduling for %s: %s", label, exc)
 
         stream = camera.stream(
             width=args.width,
@@ -122,6 +208,8 @@ def frame_producer(
             decoder=args.decoder,
             frame_rate=args.fps if args.fps > 0 else None,
             queue_size=args.stream_queue,
+            transfers=args.transfers,
+            packets_per_transfer=args.packets_per_transfer,
         )
         start_barrier.wait()
         start_event.wait()
@@ -129,33 +217,161 @@ def frame_producer(
             LOG.info("%s delaying post-barrier start by %.3f ms", label, start_delay * 1000)
             time.sleep(start_delay)
 
+        monotonic_ns = time.monotonic_ns
         with stream as frames:
             for frame in frames:
                 if stop_event.is_set():
                     break
-                packet = FramePacket(
-                    frame=frame,
-                    host_ts=time.monotonic(),
-                    pts=getattr(frame, "pts", getattr(frame, "timestamp", None)),
-                )
-                try:
-                    frame_queue.put_nowait(packet)
-                except queue.Full:
+                # CapturedFrame always defines ``pts`` (None when the payload
+                # header carried no presentation time).
+                packet = FramePacket(frame=frame, host_ts_ns=monotonic_ns(), pts=frame.pts)
+                if decode_bgr:
+                    # Decode here so each camera converts on its own thread and
+                    # the preview only copies finished images.
                     try:
-                        frame_queue.get_nowait()
-                    except queue.Empty:
-                        pass
-                    frame_queue.put_nowait(packet)
+                        packet.bgr = frame.to_bgr()
+                    except RuntimeError as exc:
+                        LOG.warning("%s failed to convert frame: %s", label, exc)
+                        continue
+                frame_ring.push(packet)
     except Exception as exc:  # pragma: no cover - diagnostic path
         LOG.exception("Producer %s failed: %s", label, exc)
     finally:
         stop_event.set()
         if original_affinity is not None:
-            with contextlib.suppress(psutil.Error):
-                proc.cpu_affinity(original_affinity)
+            with contextlib.suppress(OSError):
+                os.sched_setaffinity(0, original_affinity)
         LOG.info("Producer %s stopped", label)
 
 
+def _take_pair(
+    latest: List[Optional[Tuple[FramePacket, FramePacket]]],
+    latest_lock: threading.Lock,
+    pair_ready: threading.Event,
+) -> Optional[Tuple[FramePacket, FramePacket]]:
+    if not pair_ready.wait(timeout=0.05):
+        return None
+    with latest_lock:
+        pair = latest[0]
+        latest[0] = None
+        pair_ready.clear()
+    return pair
+
+
+def display_loop(
+    latest: List[Optional[Tuple[FramePacket, FramePacket]]],
+    latest_lock: threading.Lock,
+    pair_ready: threading.Event,
+    stop_event: threading.Event,
+) -> None:
+    """Render the most recent pair published by the pairing thread until stopped.
+
+    Must run on the main thread: HighGUI windows are not thread-safe and
+    macOS only allows them there.  The pairing thread only overwrites
+    ``latest[0]``, so a slow preview skips pairs instead of delaying pairing.
+    """
+
+    window = "stereo3"
+    cv2.namedWindow(window, cv2.WINDOW_NORMAL)
+    poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
+    canvas: Optional[np.ndarray] = None
+    try:
+        while not stop_event.is_set():
+            pair = _take_pair(latest, latest_lock, pair_ready)
+            if pair is None:
+                poll_key()
+                continue
+
+            left_bgr = pair[0].bgr
+            right_bgr = pair[1].bgr
+            height, left_width = left_bgr.shape[:2]
+            width = left_width + right_bgr.shape[1]
+            if canvas is None or canvas.shape[:2] != (height, width):
+                canvas = np.empty((height, width, 3), dtype=np.uint8)
+            # hconcat writes row-wise into the existing canvas when its shape matches.
+            cv2.hconcat((left_bgr, right_bgr), canvas)
+            cv2.imshow(window, canvas)
+            key = poll_key() & 0xFF
+            if key in (ord("q"), 27):
+                stop_event.set()
+    finally:
+        cv2.destroyAllWindows()
+
+
+def _open_gst_sinks(fps: float) -> Tuple[MJPEGPreviewPipeline, MJPEGPreviewPipeline]:
+    """Build the left/right preview pipelines, closing the left one if the right fails."""
+
+    left_sink = MJPEGPreviewPipeline(fps)
+    try:
+        right_sink = MJPEGPreviewPipeline(fps)
+    except Exception:
+        left_sink.close()
+        raise
+    return left_sink, right_sink
+
+
+def gst_display_worker(
+    latest: List[Optional[Tuple[FramePacket, FramePacket]]],
+    latest_lock: threading.Lock,
+    pair_ready: threading.Event,
+    stop_event: threading.Event,
+    left_sink: MJPEGPreviewPipeline,
+    right_sink: MJPEGPreviewPipeline,
+) -> None:
+    """Push the newest MJPEG pair straight into two GStreamer preview sinks.
+
+    ``jpegdec`` decodes inside GStreamer, so no Python-side ``to_bgr()`` or
+    canvas copy happens on this path.  The sinks are closed on exit.
+    """
+
+    try:
+        while not stop_event.is_set():
+            pair = _take_pair(latest, latest_lock, pair_ready)
+            if pair is None:
+                continue
+            left_packet, right_packet = pair
+            left_sink.push(left_packet.frame.payload, left_packet.host_ts_ns * 1e-9)
+            right_sink.push(right_packet.frame.payload, right_packet.host_ts_ns * 1e-9)
+    finally:
+        left_sink.close()
+        right_sink.close()
+
+
+def delta_printer(records: "queue.Queue[Optional[DeltaRecord]]") -> None:
+    """Format and print ``--print-deltas`` lines until a ``None`` record arrives.
+
+    Lines that piled up while stdout was blocked are written in one call.
+    """
+
+    write = sys.stdout.write
+    done = False
+    while not done:
+        batch = [records.get()]
+        # Single consumer: every record counted by qsize() is still there, so
+        # get_nowait() cannot raise queue.Empty.
+        for _ in range(records.qsize()):
+            if batch[-1] is None:
+                break
+            batch.append(records.get_nowait())
+        lines = []
+        for record in batch:
+            if record is None:
+                done = True
+                break
+            host_delta_ns, centered_ns, left_pts, right_pts = record
+            message = f"Δhost={host_delta_ns / 1e6:+.3f} ms"
+            if centered_ns is not None:
+                message += f" (centered {centered_ns / 1e6:+.3f} ms)"
+            left_pts_sec = _pts_to_seconds(left_pts)
+            right_pts_sec = _pts_to_seconds(right_pts)
+            if left_pts_sec is not None and right_pts_sec is not None:
+                message += f" ΔPTS={(left_pts_sec - right_pts_sec) * 1000:+.3f} ms"
+            lines.append(message)
+        if lines:
+            write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+
 def _parse_args() -> argparse.Namespace:
     codec_choices = ["auto", "yuyv", "mjpeg", "frame_based", "h264", "h265"]
     decoder_choices = ["auto", "none", "pyav", "gstreamer"]
@@ -167,6 +383,16 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--right-device-sn", help="Serial number of the right camera")
     parser.add_argument("--left-core", type=int, help="CPU core index for the left producer thread")
     parser.add_argument("--right-core", type=int, help="CPU core index for the right producer thread")
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pick distinct CPUs for unset --left-core/--right-core from the allowed set (Linux)",
+    )
+    parser.add_argument(
+        "--rt-priority",
+        type=int,
+        help="Run producer threads under SCHED_FIFO with this priority (Linux, needs CAP_SYS_NICE)",
+    )
     parser.add_argument("--left-start-delay-ms", type=float, default=0.0, help="Startup delay for left (ms)")
     parser.add_argument("--right-start-delay-ms", type=float, default=0.0, help="Startup delay for right (ms)")
     parser.add_argument("--interface", type=int, default=1, help="UVC interface number to claim")
@@ -185,8 +411,14 @@ def _parse_args() -> argparse.Namespace:
         choices=decoder_choices,
         help="Decoder selection for compressed payloads",
     )
-    parser.add_argument("--stream-queue", type=int, default=4, help="Internal queue size inside UVCCamera.stream")
-    parser.add_argument("--queue-size", type=int, default=3, help="Buffered frames per camera in the consumer")
+    add_transfer_arguments(parser)
+    parser.add_argument("--stream-queue", type=int, default=2, help="Internal queue size inside UVCCamera.stream")
+    parser.add_argument("--queue-size", type=int, default=1, help="Buffered frames per camera in the consumer")
+    parser.add_argument(
+        "--latency-mode",
+        action="store_true",
+        help="Keep a single frame per stage (implies --queue-size 1 --stream-queue 1 --pairing-mode latest)",
+    )
     parser.add_argument("--max-ts-diff", type=float, default=0.020, help="Host delta tolerance during pairing (s)")
     parser.add_argument(
         "--pairing-mode",
@@ -209,6 +441,11 @@ def _parse_args() -> argparse.Namespace:
         help="Pairs between stats logs (0 disables)",
     )
     parser.add_argument("--display", action="store_true", help="Show OpenCV preview")
+    parser.add_argument(
+        "--gst-preview",
+        action="store_true",
+        help="With --codec mjpeg, preview through GStreamer jpegdec sinks instead of OpenCV",
+    )
     parser.add_argument("--log-level", default="INFO")
     args = parser.parse_args()
     logging.basicConfig(level=args.log_level.upper())
@@ -217,66 +454,197 @@ def _parse_args() -> argparse.Namespace:
         args.device_id = parse_device_id(args.device_id)
 
     args.codec = _normalise_codec(args.codec)
+    if args.gst_preview and args.codec != CodecPreference.MJPEG:
+        parser.error("--gst-preview requires --codec mjpeg")
     args.decoder = _normalise_decoder(args.decoder)
     args.left_start_delay = max(args.left_start_delay_ms, 0.0) / 1000.0
     args.right_start_delay = max(args.right_start_delay_ms, 0.0) / 1000.0
     args.pairing_mode = args.pairing_mode.lower()
+    if args.latency_mode:
+        args.queue_size = 1
+        args.stream_queue = 1
+        args.pairing_mode = "latest"
     args.target_delta = args.target_delta_ms / 1000.0 if args.target_delta_ms is not None else None
     args.calibration_pairs = max(args.calibration_pairs, 0)
+    if args.pin_cpus:
+        _assign_producer_cores(args)
     return args
 
 
+def _assign_producer_cores(args: argparse.Namespace) -> None:
+    """Fill unset producer cores with the highest allowed CPUs, leaving the first for the consumer."""
+
+    try:
+        allowed = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        LOG.warning("--pin-cpus needs os.sched_getaffinity (Linux); leaving threads unpinned")
+        return
+    taken = {args.left_core, args.right_core}
+    spare = [cpu for cpu in reversed(allowed[1:]) if cpu not in taken]
+    if args.left_core is None and spare:
+        args.left_core = spare.pop(0)
+    if args.right_core is None and spare:
+        args.right_core = spare.pop(0)
+    if args.left_core is None or args.right_core is None:
+        LOG.warning("Not enough spare CPUs to pin both producers")
+    LOG.info("Producer cores: left=%s right=%s", args.left_core, args.right_core)
+
+
 def _drain_queue(
     current: Optional[FramePacket],
-    source: queue.Queue,
+    source: FrameRing,
     *,
     drain: bool,
 ) -> Optional[FramePacket]:
     if not drain:
         if current is not None:
             return current
-        try:
-            return source.get(timeout=0.05)
-        except queue.Empty:
-            return None
+        return source.get()
 
-    item = current
-    if item is None:
-        try:
-            item = source.get(timeout=0.05)
-        except queue.Empty:
-            return None
-    while True:
-        try:
-            item = source.get_nowait()
-        except queue.Empty:
-            break
-    return item
+    latest = source.take_latest()
+    return latest if latest is not None else current
 
 
-def _flush_queue(buffer: queue.Queue) -> None:
-    while True:
-        try:
-            buffer.get_nowait()
-        except queue.Empty:
-            break
+def pair_frames(
+    left_ring: FrameRing,
+    right_ring: FrameRing,
+    frame_ready: threading.Event,
+    stop_event: threading.Event,
+    args: argparse.Namespace,
+    *,
+    delta_records: Optional["queue.Queue[Optional[DeltaRecord]]"] = None,
+    display: Optional[
+        Tuple[List[Optional[Tuple[FramePacket, FramePacket]]], threading.Lock, threading.Event]
+    ] = None,
+) -> None:
+    """Match left/right packets by host timestamp until *stop_event* is set.
+
+    Accepted pairs go to *delta_records* and, when *display* is given as
+    ``(slot, lock, ready)``, replace the pair waiting in ``slot[0]``.
+    """
+
+    left_frame: Optional[FramePacket] = None
+    right_frame: Optional[FramePacket] = None
+    drain_latest = args.pairing_mode == "latest"
+
+    calibration_remaining = args.calibration_pairs
+    accumulated_delta_ns = 0
+    pair_count = 0
+    drop_left = 0
+    drop_right = 0
+    stats_next = args.stats_interval if args.stats_interval else None
+
+    # Host deltas stay in integer nanoseconds; only log output converts to ms.
+    target_delta_ns = round(args.target_delta * 1e9) if args.target_delta is not None else None
+    # Loop-invariant options, read once instead of per pair.
+    max_ts_diff_ns = round(args.max_ts_diff * 1e9)
+    calibration_pairs = max(args.calibration_pairs, 1)
+
+    try:
+        while not stop_event.is_set():
+            left_frame = _drain_queue(left_frame, left_ring, drain=drain_latest)
+            right_frame = _drain_queue(right_frame, right_ring, drain=drain_latest)
+
+            if left_frame is None or right_frame is None:
+                frame_ready.clear()
+                # Re-check after clearing so a push racing with clear() is not missed.
+                left_frame = _drain_queue(left_frame, left_ring, drain=drain_latest)
+                right_frame = _drain_queue(right_frame, right_ring, drain=drain_latest)
+                if left_frame is None or right_frame is None:
+                    # Producers set stop_event when they exit, ending the loop.
+                    frame_ready.wait(timeout=0.5)
+                    continue
+
+            host_delta_ns = left_frame.host_ts_ns - right_frame.host_ts_ns
+
+            if target_delta_ns is None and calibration_remaining > 0:
+                accumulated_delta_ns += host_delta_ns
+                calibration_remaining -= 1
+                if calibration_remaining == 0:
+                    target_delta_ns = accumulated_delta_ns // calibration_pairs
+                    LOG.info("Calibration locked target delta at %.3f ms", target_delta_ns / 1e6)
+
+            effective_delta_ns = host_delta_ns - (target_delta_ns or 0)
+            if abs(effective_delta_ns) > max_ts_diff_ns:
+                if effective_delta_ns < 0:
+                    left_frame = None
+                    drop_left += 1
+                else:
+                    right_frame = None
+                    drop_right += 1
+                continue
+
+            if delta_records is not None:
+                # Formatting and stdout writes happen on the printer thread; if
+                # it falls behind, lines are dropped rather than stalling pairing.
+                with contextlib.suppress(queue.Full):
+                    delta_records.put_nowait(
+                        (
+                            host_delta_ns,
+                            effective_delta_ns if target_delta_ns else None,
+                            left_frame.pts,
+                            right_frame.pts,
+                        )
+                    )
+
+            if display is not None:
+                display_slot, display_lock, display_ready = display
+                with display_lock:
+                    display_slot[0] = (left_frame, right_frame)
+                    display_ready.set()
+
+            left_frame = None
+            right_frame = None
+            pair_count += 1
+
+            if stats_next and pair_count % stats_next == 0:
+                LOG.info(
+                    "Pairs=%d drops(L=%d R=%d) target=%.3f ms",
+                    pair_count,
+                    drop_left,
+                    drop_right,
+                    (target_delta_ns or 0) / 1e6,
+                )
+    finally:
+        # Let the display loop on the main thread exit if pairing stops first.
+        stop_event.set()
 
 
 def main() -> int:
     args = _parse_args()
+    if args.display and not args.gst_preview and cv2 is None:
+        LOG.error("OpenCV is required when --display is specified")
+        return 1
+
+    gst_sinks: Optional[Tuple[MJPEGPreviewPipeline, MJPEGPreviewPipeline]] = None
+    if args.gst_preview:
+        if not GST_AVAILABLE:
+            LOG.error("--gst-preview requires the GStreamer Python bindings (python3-gi)")
+            return 1
+        try:
+            gst_sinks = _open_gst_sinks(args.fps)
+        except Exception as exc:
+            LOG.error("Unable to start the GStreamer preview: %s", exc)
+            return 1
 
     try:
-        left_cam = _select_camera(args, "left")
-        right_cam = _select_camera(args, "right")
+        left_cam = _select_camera(args, "left", args.left_index, args.left_device_sn)
+        right_cam = _select_camera(args, "right", args.right_index, args.right_device_sn)
     except UVCError as exc:
         LOG.error("Unable to open cameras: %s", exc)
+        if gst_sinks is not None:
+            for sink in gst_sinks:
+                sink.close()
         return 1
 
     LOG.info("Left : %s", describe_device(left_cam.device))
     LOG.info("Right: %s", describe_device(right_cam.device))
 
-    left_queue: queue.Queue = queue.Queue(maxsize=args.queue_size)
-    right_queue: queue.Queue = queue.Queue(maxsize=args.queue_size)
+    # Both producers signal the same event, so the consumer sleeps until either
+    # camera publishes instead of polling each ring with a timeout.
+    frame_ready = threading.Event()
+    left_queue = FrameRing(args.queue_size, frame_ready)
+    right_queue = FrameRing(args.queue_size, frame_ready)
     stop_event = threading.Event()
     start_barrier = threading.Barrier(3)
     start_event = threading.Event()
@@ -293,6 +661,8 @@ def main() -> int:
             "left",
             args.left_core,
             args.left_start_delay,
+            args.rt_priority,
+            args.display and not args.gst_preview,
         ),
         name="left-producer",
         daemon=True,
@@ -309,6 +679,8 @@ def main() -> int:
             "right",
             args.right_core,
             args.right_start_delay,
+            args.rt_priority,
+            args.display and not args.gst_preview,
         ),
         name="right-producer",
         daemon=True,
@@ -318,106 +690,70 @@ def main() -> int:
 
     start_barrier.wait()
     time.sleep(0.2)
-    _flush_queue(left_queue)
-    _flush_queue(right_queue)
+    left_queue.clear()
+    right_queue.clear()
     start_event.set()
 
-    left_frame: Optional[FramePacket] = None
-    right_frame: Optional[FramePacket] = None
-    drain_latest = args.pairing_mode == "latest"
-
-    calibration_remaining = args.calibration_pairs
-    accumulated_delta = 0.0
-    pair_count = 0
-    drop_left = 0
-    drop_right = 0
-    stats_next = args.stats_interval if args.stats_interval else None
-
-    target_delta = args.target_delta
-    if args.display and cv2 is None:
-        raise RuntimeError("OpenCV is required when --display is specified")
-    if args.display:
-        cv2.namedWindow("stereo3", cv2.WINDOW_NORMAL)
+    display_slot: List[Optional[Tuple[FramePacket, FramePacket]]] = [None]
+    display_lock = threading.Lock()
+    display_ready = threading.Event()
+    display = (display_slot, display_lock, display_ready) if args.display or args.gst_preview else None
+    display_thread: Optional[threading.Thread] = None
+    if gst_sinks is not None:
+        display_thread = threading.Thread(
+            target=gst_display_worker,
+            args=(display_slot, display_lock, display_ready, stop_event, *gst_sinks),
+            name="stereo-display",
+            daemon=True,
+        )
+        display_thread.start()
+
+    delta_records: Optional["queue.Queue[Optional[DeltaRecord]]"] = None
+    printer_thread: Optional[threading.Thread] = None
+    if args.print_deltas:
+        delta_records = queue.Queue(maxsize=256)
+        printer_thread = threading.Thread(
+            target=delta_printer,
+            args=(delta_records,),
+            name="stereo-deltas",
+            daemon=True,
+        )
+        printer_thread.start()
 
+    pairing_args = (left_queue, right_queue, frame_ready, stop_event, args)
+    pairing_kwargs = {"delta_records": delta_records, "display": display}
+    pairing_thread: Optional[threading.Thread] = None
     try:
-        while not stop_event.is_set():
-            left_frame = _drain_queue(left_frame, left_queue, drain=drain_latest)
-            right_frame = _drain_queue(right_frame, right_queue, drain=drain_latest)
-
-            if left_frame is None or right_frame is None:
-                if not left_thread.is_alive() or not right_thread.is_alive():
-                    break
-                continue
-
-            host_delta = left_frame.host_ts - right_frame.host_ts
-            left_pts_sec = _pts_to_seconds(left_frame.pts)
-            right_pts_sec = _pts_to_seconds(right_frame.pts)
-            pts_delta = None
-            if left_pts_sec is not None and right_pts_sec is not None:
-                pts_delta = left_pts_sec - right_pts_sec
-
-            if target_delta is None and calibration_remaining > 0:
-                accumulated_delta += host_delta
-                calibration_remaining -= 1
-                if calibration_remaining == 0:
-                    target_delta = accumulated_delta / max(args.calibration_pairs, 1)
-                    LOG.info("Calibration locked target delta at %.3f ms", target_delta * 1000)
-
-            effective_delta = host_delta - (target_delta or 0.0)
-            if abs(effective_delta) > args.max_ts_diff:
-                if effective_delta < 0:
-                    left_frame = None
-                    drop_left += 1
-                else:
-                    right_frame = None
-                    drop_right += 1
-                continue
-
-            if args.print_deltas:
-                message = f"Δhost={(host_delta)*1000:+.3f} ms"
-                if target_delta:
-                    message += f" (centered {effective_delta*1000:+.3f} ms)"
-                if pts_delta is not None:
-                    message += f" ΔPTS={pts_delta*1000:+.3f} ms"
-                print(message)
-
-            if args.display:
-                try:
-                    left_bgr = left_frame.frame.to_bgr()
-                    right_bgr = right_frame.frame.to_bgr()
-                except RuntimeError as exc:
-                    LOG.warning("Failed to convert frame: %s", exc)
-                    left_frame = None
-                    right_frame = None
-                    continue
-                stereo = np.hstack((left_bgr, right_bgr))
-                cv2.imshow("stereo3", stereo)
-                key = cv2.waitKey(1) & 0xFF
-                if key in (ord("q"), 27):
-                    break
-
-            left_frame = None
-            right_frame = None
-            pair_count += 1
-
-            if stats_next and pair_count % stats_next == 0:
-                LOG.info(
-                    "Pairs=%d drops(L=%d R=%d) target=%.3f ms",
-                    pair_count,
-                    drop_left,
-                    drop_right,
-                    (target_delta or 0.0) * 1000,
-                )
+        if args.display and not args.gst_preview:
+            # Same split as uvc_capture_video: pairing runs on a worker thread
+            # and the OpenCV window loop keeps the main thread.
+            pairing_thread = threading.Thread(
+                target=pair_frames,
+                args=pairing_args,
+                kwargs=pairing_kwargs,
+                name="stereo-pairing",
+                daemon=True,
+            )
+            pairing_thread.start()
+            display_loop(display_slot, display_lock, display_ready, stop_event)
+        else:
+            pair_frames(*pairing_args, **pairing_kwargs)
     except KeyboardInterrupt:
         LOG.info("Interrupted by user")
     finally:
         stop_event.set()
+        if pairing_thread is not None:
+            pairing_thread.join(timeout=1)
         left_thread.join(timeout=1)
         right_thread.join(timeout=1)
         left_cam.close()
         right_cam.close()
-        if args.display and cv2 is not None:
-            cv2.destroyAllWindows()
+        if display_thread is not None:
+            display_thread.join(timeout=1)
+        if printer_thread is not None:
+            with contextlib.suppress(queue.Full):
+                delta_records.put(None, timeout=1)
+            printer_thread.join(timeout=1)
 
     return 0
 
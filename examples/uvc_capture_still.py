@@ -7,6 +7,7 @@ import argparse
 import logging
 import pathlib
 import sys
+from io import BytesIO
 from pathlib import Path
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -32,6 +33,8 @@ except ImportError:  # pragma: no cover
         describe_device,
     )
 
+from uvc_cli import CONVERTIBLE_SUFFIXES, JPEG_SUFFIXES, write_payload
+
 LOG = logging.getLogger("capture_still")
 
 
@@ -39,37 +42,42 @@ def save_payload(output_path: Path, payload: bytes, stream_format, frame_info) -
     suffix = output_path.suffix.lower()
 
     if stream_format.subtype == VS_FORMAT_MJPEG:
-        if suffix in {".jpg", ".jpeg"}:
-            output_path.write_bytes(payload)
+        if suffix in JPEG_SUFFIXES:
+            write_payload(output_path, payload)
             LOG.info("Saved MJPEG payload directly to %s", output_path)
             return
-        try:
-            import cv2
-            import numpy as np
-
-            arr = np.frombuffer(payload, dtype=np.uint8)
-            bgr = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-            if bgr is None:
-                raise RuntimeError("cv2.imdecode returned None")
-            rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-        except ImportError:
-            LOG.warning("OpenCV unavailable; storing MJPEG payload as raw bytes")
-            output_path.with_suffix(".raw").write_bytes(payload)
-            return
-        except Exception as exc:
-            LOG.warning("Failed to decode MJPEG payload (%s); storing raw bytes", exc)
-            output_path.with_suffix(".raw").write_bytes(payload)
+        if suffix not in CONVERTIBLE_SUFFIXES:
+            write_payload(output_path, payload)
+            LOG.info("Saved MJPEG payload without conversion to %s", output_path)
             return
 
         try:
             from PIL import Image  # type: ignore
         except ImportError:
             LOG.warning("Pillow unavailable; storing MJPEG payload as raw bytes")
-            output_path.with_suffix(".raw").write_bytes(payload)
+            write_payload(output_path.with_suffix(".raw"), payload)
+            return
+
+        try:
+            # Pillow converts on its own; numpy/OpenCV are only loaded if it fails.
+            with Image.open(BytesIO(payload)) as image:
+                image.load()
+                image.save(output_path)
+            LOG.info("Converted MJPEG payload to %s", suffix)
+            return
+        except Exception as exc:
+            LOG.debug("Pillow could not convert MJPEG payload (%s); trying OpenCV", exc)
+
+        try:
+            # OpenCV fallback; decode_to_rgb handles the RGB flag and BGR fallback.
+            rgb = decode_to_rgb(payload, stream_format, frame_info)
+        except Exception as exc:
+            LOG.warning("Failed to decode MJPEG payload (%s); storing raw bytes", exc)
+            write_payload(output_path.with_suffix(".raw"), payload)
             return
 
         Image.fromarray(rgb).save(output_path)
-        LOG.info("Converted MJPEG payload to %s", suffix or ".png")
+        LOG.info("Converted MJPEG payload to %s", suffix)
         return
 
     if stream_format.subtype == VS_FORMAT_UNCOMPRESSED:
@@ -78,7 +86,7 @@ def save_payload(output_path: Path, payload: bytes, stream_format, frame_info) -
             from PIL import Image  # type: ignore
         except ImportError:
             LOG.warning("Pillow unavailable; storing raw payload for uncompressed frame")
-            output_path.with_suffix(".raw").write_bytes(payload)
+            write_payload(output_path.with_suffix(".raw"), payload)
             return
 
         if suffix not in {".tiff", ".tif"}:
@@ -89,7 +97,7 @@ def save_payload(output_path: Path, payload: bytes, stream_format, frame_info) -
         return
 
     LOG.warning("Unknown format subtype 0x%02x; storing raw payload", stream_format.subtype)
-    output_path.write_bytes(payload)
+    write_payload(output_path, payload)
 
 
 def main() -> int:
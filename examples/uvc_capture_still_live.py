@@ -9,6 +9,7 @@ import sys
 import threading
 import time
 from pathlib import Path
+from typing import Optional
 
 ROOT = Path(__file__).resolve().parents[1]
 try:
@@ -18,38 +19,59 @@ except ImportError:  # pragma: no cover
     from libusb_uvc import CodecPreference, UVCCamera, UVCError, describe_device
 
 from uvc_capture_still import save_payload  # reuse helper
+from uvc_cli import add_transfer_arguments
 
 
 LOG = logging.getLogger("capture_still_live")
 
 
-def stream_worker(camera: UVCCamera, stop_event: threading.Event, log_interval: float = 5.0) -> None:
-    """Background thread that keeps a MJPEG stream running."""
-
-    stream = camera.stream(
-        width=1280,
-        height=720,
-        codec=CodecPreference.MJPEG,
-        frame_rate=15,
-        queue_size=4,
-        skip_initial=2,
-        timeout_ms=1000,
-    )
-
-    with stream as frames:
-        last_log = time.time()
-        for frame in frames:
-            if stop_event.is_set():
-                break
-            now = time.time()
-            if now - last_log > log_interval:
-                LOG.debug(
-                    "Streaming keep-alive: frame %sx%s (%d bytes)",
-                    frame.frame.width,
-                    frame.frame.height,
-                    len(frame.payload),
-                )
-                last_log = now
+def stream_worker(
+    camera: UVCCamera,
+    stop_event: threading.Event,
+    log_interval: float = 5.0,
+    *,
+    primed: Optional[threading.Event] = None,
+    transfers: int = 16,
+    packets_per_transfer: int = 64,
+) -> None:
+    """Background thread that keeps a MJPEG stream running.
+
+    *primed* is set once the first frame past ``skip_initial`` arrives, or when
+    the worker exits, so the caller never waits on a dead stream.
+    """
+
+    try:
+        stream = camera.stream(
+            width=1280,
+            height=720,
+            codec=CodecPreference.MJPEG,
+            frame_rate=15,
+            queue_size=4,
+            skip_initial=2,
+            transfers=transfers,
+            packets_per_transfer=packets_per_transfer,
+            timeout_ms=1000,
+        )
+
+        with stream as frames:
+            last_log = time.time()
+            for frame in frames:
+                if primed is not None:
+                    primed.set()
+                if stop_event.is_set():
+                    break
+                now = time.time()
+                if now - last_log > log_interval:
+                    LOG.debug(
+                        "Streaming keep-alive: frame %sx%s (%d bytes)",
+                        frame.frame.width,
+                        frame.frame.height,
+                        len(frame.payload),
+                    )
+                    last_log = now
+    finally:
+        if primed is not None:
+            primed.set()
 
 
 def main() -> int:
@@ -62,6 +84,7 @@ def main() -> int:
     parser.add_argument("--height", type=int, help="Still image height")
     parser.add_argument("--timeout", type=int, default=10000, help="Still capture timeout in milliseconds")
     parser.add_argument("--output", type=Path, required=True, help="Destination file (e.g. still.tiff)")
+    add_transfer_arguments(parser)
     parser.add_argument("--log-level", default="INFO")
     args = parser.parse_args()
 
@@ -77,11 +100,23 @@ def main() -> int:
             print(f"Using device: {describe_device(camera.device)}")
 
             stop_event = threading.Event()
-            worker = threading.Thread(target=stream_worker, args=(camera, stop_event), daemon=True)
+            primed = threading.Event()
+            worker = threading.Thread(
+                target=stream_worker,
+                args=(camera, stop_event),
+                kwargs={
+                    "primed": primed,
+                    "transfers": args.transfers,
+                    "packets_per_transfer": args.packets_per_transfer,
+                },
+                daemon=True,
+            )
             worker.start()
 
             try:
-                time.sleep(2.0)
+                # Proceed as soon as the stream delivers frames instead of a fixed sleep.
+                if not primed.wait(timeout=5.0):
+                    LOG.warning("MJPEG stream produced no frame within 5 s; continuing")
             finally:
                 stop_event.set()
                 worker.join(timeout=2.0)
@@ -5,15 +5,26 @@ from __future__ import annotations
 
 import argparse
 import logging
+import threading
 import time
 from pathlib import Path
+from typing import Iterable, List, Optional
 
 import cv2
-
-from uvc_cli import add_device_arguments, apply_device_filters, configure_logging, ensure_repo_import, resolve_device_index
+import numpy as np
+
+from uvc_cli import (
+    add_device_arguments,
+    add_transfer_arguments,
+    apply_device_filters,
+    configure_logging,
+    ensure_repo_import,
+    resolve_device_index,
+)
 
 ensure_repo_import()
 from libusb_uvc import (
+    CapturedFrame,
     CodecPreference,
     DecoderPreference,
     StreamingInterface,
@@ -23,6 +34,7 @@ from libusb_uvc import (
 )
 
 LOG = logging.getLogger("capture_video")
+_poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
 
 
 def _format_fps_list(frame) -> str:
@@ -32,6 +44,33 @@ def _format_fps_list(frame) -> str:
     return ", ".join(f"{fps:.2f}" for fps in fps_values)
 
 
+def capture_worker(
+    frames: Iterable[CapturedFrame],
+    latest: List[Optional[np.ndarray]],
+    frame_ready: threading.Event,
+    stop_event: threading.Event,
+) -> None:
+    """Convert frames to BGR and publish the newest one in ``latest[0]``.
+
+    Running this off the GUI thread keeps ``imshow`` and the window event pump
+    from delaying the stream; frames the preview cannot keep up with are
+    simply overwritten.
+    """
+
+    try:
+        for frame in frames:
+            if stop_event.is_set():
+                break
+            try:
+                latest[0] = frame.to_bgr()
+            except RuntimeError as exc:
+                LOG.warning("Frame conversion failed: %s", exc)
+                continue
+            frame_ready.set()
+    finally:
+        stop_event.set()
+
+
 def print_streaming_modes(streaming: StreamingInterface) -> None:
     print(f"Streaming interface {streaming.interface_number}")
     print("Formats:")
@@ -66,6 +105,7 @@ def main() -> int:
     parser.add_argument("--fps", type=float, default=15.0, help="Target frame rate in Hz")
     parser.add_argument("--skip-frames", type=int, default=2, help="Frames to discard before display")
     parser.add_argument("--timeout", type=int, default=3000, help="Async transfer timeout (ms)")
+    add_transfer_arguments(parser)
     parser.add_argument(
         "--codec",
         choices=[
@@ -129,6 +169,8 @@ def main() -> int:
                 strict_fps=args.strict_fps,
                 queue_size=6,
                 skip_initial=max(0, args.skip_frames),
+                transfers=args.transfers,
+                packets_per_transfer=args.packets_per_transfer,
                 timeout_ms=max(args.timeout, 1000),
                 duration=args.duration,
                 record_to=args.record,
@@ -143,16 +185,26 @@ def main() -> int:
                     LOG.error("OpenCV window creation failed: %s", exc)
                     return 1
 
+                latest: List[Optional[np.ndarray]] = [None]
+                frame_ready = threading.Event()
+                stop_event = threading.Event()
+                worker = threading.Thread(
+                    target=capture_worker,
+                    args=(frames, latest, frame_ready, stop_event),
+                    name="capture-video",
+                    daemon=True,
+                )
+                worker.start()
                 try:
-                    for frame in frames:
-                        try:
-                            bgr = frame.to_bgr()
-                        except RuntimeError as exc:
-                            LOG.warning("Frame conversion failed: %s", exc)
-                            continue
-
-                        cv2.imshow(window, bgr)
-                        key = cv2.waitKey(1) & 0xFF
+                    # The GUI stays on the main thread (required on macOS); it only
+                    # shows the newest converted frame and pumps window events.
+                    while not stop_event.is_set():
+                        if frame_ready.wait(timeout=0.05):
+                            frame_ready.clear()
+                            bgr = latest[0]
+                            if bgr is not None:
+                                cv2.imshow(window, bgr)
+                        key = _poll_key() & 0xFF
                         if key in (ord("q"), 27):
                             break
                         if args.duration and (time.time() - start) >= args.duration:
@@ -160,6 +212,8 @@ def main() -> int:
                 except KeyboardInterrupt:
                     LOG.info("Capture interrupted after %.2fs", time.time() - start)
                 finally:
+                    stop_event.set()
+                    worker.join(timeout=1.0)
                     cv2.destroyWindow(window)
 
     except UVCError as exc:
@@ -5,13 +5,17 @@ from __future__ import annotations
 import argparse
 import importlib
 import logging
+import os
 import pathlib
+import re
 import sys
 from typing import List, Optional, Tuple
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT / "src"
 
+_HEX_TOKEN_RE = re.compile(r"(?:0x)?([0-9a-f]+)")
+
 
 def ensure_repo_import(package: str = "libusb_uvc") -> None:
     """Ensure the editable checkout is importable before importing *package*."""
@@ -37,18 +41,13 @@ def parse_usb_id(value: str, *, prefer_hex: bool = False) -> int:
     token = value.strip()
     token_lower = token.lower()
 
-    def _parse_hex(raw: str) -> int:
-        raw = raw.lower()
-        if raw.startswith("0x"):
-            raw = raw[2:]
-        if not raw or any(ch not in "0123456789abcdef" for ch in raw):
-            raise argparse.ArgumentTypeError(f"Invalid USB identifier: {value!r}")
-        return int(raw, 16)
-
     try:
         parsed = int(token, 0)
     except ValueError:
-        parsed = _parse_hex(token_lower)
+        match = _HEX_TOKEN_RE.fullmatch(token_lower)
+        if match is None:
+            raise argparse.ArgumentTypeError(f"Invalid USB identifier: {value!r}") from None
+        parsed = int(match.group(1), 16)
     else:
         if prefer_hex and token_lower.isdigit():
             parsed = int(token_lower, 16)
@@ -121,6 +120,42 @@ def add_device_arguments(parser: argparse.ArgumentParser, *, default_index: Opti
     parser.add_argument("--interface", type=int, default=1, help="Video streaming interface number")
 
 
+def add_transfer_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add libusb isochronous transfer sizing knobs passed to ``UVCCamera.stream``."""
+
+    parser.add_argument(
+        "--transfers",
+        type=int,
+        default=16,
+        help="Isochronous transfers kept in flight (more keeps the bus busy between completions)",
+    )
+    parser.add_argument(
+        "--packets-per-transfer",
+        type=int,
+        default=64,
+        help="ISO packets per transfer; each transfer buffers packets x wMaxPacketSize bytes",
+    )
+
+
+# MJPEG payloads are complete JPEG files and are written out unchanged.
+JPEG_SUFFIXES = frozenset({".jpg", ".jpeg"})
+# Suffixes Pillow can encode; anything else receives the MJPEG bytes unchanged.
+CONVERTIBLE_SUFFIXES = frozenset({".png", ".bmp", ".tiff", ".tif", ".webp"})
+
+
+def write_payload(path: pathlib.Path, payload: bytes) -> None:
+    """Write *payload* through a raw file descriptor, bypassing the buffered I/O stack."""
+
+    view = memoryview(payload)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
 def configure_logging(level: str = "INFO", *, name: Optional[str] = None) -> logging.Logger:
     """Initialise basic logging and return the requested logger."""
 
@@ -180,16 +215,8 @@ def resolve_device_index(args) -> None:
 
     matches: List[int] = []
     for index, dev in enumerate(devices):
-        if target_sn:
-            serial = None
-            try:
-                if dev.iSerialNumber:
-                    serial = usb.util.get_string(dev, dev.iSerialNumber)
-            except Exception:
-                serial = None
-            if serial != target_sn:
-                continue
-
+        # Topology comes from the cached descriptors; check it before the serial
+        # number, which costs a GET_DESCRIPTOR control transfer per device.
         if target_path is not None:
             if getattr(dev, "bus", None) != bus_expected:
                 continue
@@ -201,6 +228,16 @@ def resolve_device_index(args) -> None:
             if ports is None or tuple(ports) != ports_expected:
                 continue
 
+        if target_sn:
+            serial = None
+            try:
+                if dev.iSerialNumber:
+                    serial = usb.util.get_string(dev, dev.iSerialNumber)
+            except Exception:
+                serial = None
+            if serial != target_sn:
+                continue
+
         matches.append(index)
 
     if not matches:
@@ -18,7 +18,7 @@ import matplotlib.pyplot as plt
 from uvc_cli import add_device_arguments, apply_device_filters, configure_logging, ensure_repo_import, resolve_device_index
 
 ensure_repo_import()
-from libusb_uvc import CodecPreference, UVCCamera, UVCError, decode_to_rgb, describe_device
+from libusb_uvc import CodecPreference, UVCCamera, UVCError, describe_device
 
 LOG = logging.getLogger("display_frame")
 
@@ -87,21 +87,23 @@ def main() -> int:
         return 1
 
     try:
-        rgb = decode_to_rgb(captured.payload, captured.format, captured.frame)
+        # Reuses the stream decoder's output (PyAV/GStreamer for frame-based
+        # codecs) and only falls back to decode_to_rgb for raw payloads.
+        rgb = captured.to_rgb()
     except RuntimeError as exc:
         print(f"Failed to decode frame: {exc}")
         return 1
 
-    plt.figure("libusb_uvc_frame")
-    plt.imshow(rgb)
-    plt.axis("off")
-    plt.title(f"{captured.frame.width}x{captured.frame.height} - {captured.format.description}")
-
     if matplotlib.get_backend().lower() == "agg":
+        # imsave writes the pixels as-is without building a figure or canvas.
         output_path = Path("libusb_uvc_frame.png")
-        plt.savefig(output_path)
+        plt.imsave(output_path, rgb)
         print(f"Headless environment detected; saved frame to {output_path}")
     else:
+        plt.figure("libusb_uvc_frame")
+        plt.imshow(rgb)
+        plt.axis("off")
+        plt.title(f"{captured.frame.width}x{captured.frame.height} - {captured.format.description}")
         plt.show()
 
     return 0
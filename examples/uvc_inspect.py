@@ -4,8 +4,9 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import usb.core
 import usb.util
@@ -25,6 +26,7 @@ from libusb_uvc import (  # type: ignore  # pylint: disable=wrong-import-positio
     GET_MAX,
     GET_MIN,
     GET_RES,
+    REQ_TYPE_IN,
     CapturedFrame,
     CodecPreference,
     ControlEntry,
@@ -37,6 +39,7 @@ from libusb_uvc import (  # type: ignore  # pylint: disable=wrong-import-positio
     claim_vc_interface,
     describe_device,
     find_uvc_devices,
+    get_device_string,
     list_control_units,
     list_streaming_interfaces,
     probe_streaming_interface,
@@ -55,28 +58,22 @@ def print_device_summary(vid: Optional[int], pid: Optional[int]) -> int:
     print("Detected UVC devices:")
     for idx, dev in enumerate(devices):
         desc = describe_device(dev)
-        bus = getattr(dev, "bus", "?")
-        address = getattr(dev, "address", "?")
-        ports = getattr(dev, "port_numbers", None)
-        if ports:
-            path = ".".join(str(p) for p in ports)
-        else:
-            single = getattr(dev, "port_number", None)
-            path = str(single) if single is not None else "-"
-        serial = None
-        try:
-            if dev.iSerialNumber:
-                serial = usb.util.get_string(dev, dev.iSerialNumber)
-        except Exception:
-            serial = None
+        serial = get_device_string(dev, dev.iSerialNumber)
         print(f"[{idx}] {desc}")
         print(
             f"    VID:PID=0x{dev.idVendor:04x}:0x{dev.idProduct:04x} "
-            f"bus={bus} addr={address} path={path} serial={serial or '-'}"
+            f"bus={dev.bus} addr={dev.address} path={_port_path(dev)} serial={serial or '-'}"
         )
     return 0
 
 
+def _port_path(dev: usb.core.Device) -> str:
+    ports = dev.port_numbers
+    if ports:
+        return ".".join(map(str, ports))
+    return "-" if dev.port_number is None else str(dev.port_number)
+
+
 def _fetch_control_value(
     dev: usb.core.Device,
     control: ControlEntry,
@@ -84,20 +81,19 @@ def _fetch_control_value(
     *,
     length_hint: Optional[int] = None,
 ) -> Optional[bytes]:
+    """Issue a class GET request; the caller must hold the VC interface claim."""
+
     if length_hint is None:
         length_hint = control.length or len(control.raw_default or b"") or 4
     try:
-        with claim_vc_interface(dev, control.interface_number):
-            data = dev.ctrl_transfer(
-                usb.util.build_request_type(
-                    usb.util.CTRL_IN, usb.util.CTRL_TYPE_CLASS, usb.util.CTRL_RECIPIENT_INTERFACE
-                ),
-                request,
-                control.selector << 8,
-                (control.interface_number << 8) | control.unit_id,
-                length_hint,
-                timeout=500,
-            )
+        data = dev.ctrl_transfer(
+            REQ_TYPE_IN,
+            request,
+            control.selector << 8,
+            (control.interface_number << 8) | control.unit_id,
+            length_hint,
+            timeout=500,
+        )
     except (usb.core.USBError, RuntimeError):
         return None
     return bytes(data) if data is not None else None
@@ -122,45 +118,56 @@ def print_controls(dev: usb.core.Device) -> None:
 
     for interface_number, units in units_map.items():
         print(f"  Interface {interface_number}:")
-        try:
-            with claim_vc_interface(dev, interface_number):
+        # One claim covers discovery and every GET_CUR: each claim may rebind
+        # the kernel driver, which costs far more than the transfers.
+        with contextlib.ExitStack() as stack:
+            # Only claiming and enumeration are reported as claim failures;
+            # errors while printing entries propagate unchanged.
+            try:
+                stack.enter_context(claim_vc_interface(dev, interface_number))
                 manager = UVCControlsManager(dev, units, interface_number=interface_number)
                 controls = manager.get_controls()
-        except RuntimeError as exc:
-            print(f"    Unable to claim VC interface {interface_number}: {exc}")
-            continue
-        if not controls:
-            print("    (No validated controls)")
-            continue
-        for entry in controls:
-            details = [f"info=0x{entry.info:02x}"]
-            if entry.minimum is not None:
-                details.append(f"min={entry.minimum}")
-            if entry.maximum is not None:
-                details.append(f"max={entry.maximum}")
-            if entry.step is not None:
-                details.append(f"step={entry.step}")
-            if entry.default is not None:
-                details.append(f"def={entry.default}")
-
-            cur_raw = _fetch_control_value(dev, entry, GET_CUR, length_hint=entry.length)
-            if cur_raw is not None:
-                signed = entry.minimum is not None and entry.minimum < 0
-                formatted = _format_value("cur", cur_raw, signed=signed)
-                if formatted:
-                    details.append(formatted)
-            print(
-                f"    Unit {entry.unit_id} ({entry.type}) selector {entry.selector}: {entry.name}"
-            )
-            print(f"      ({', '.join(details)})")
+            except RuntimeError as exc:
+                print(f"    Unable to claim VC interface {interface_number}: {exc}")
+                continue
+            if not controls:
+                print("    (No validated controls)")
+                continue
+            for entry in controls:
+                _print_control_entry(dev, entry)
+
+
+def _print_control_entry(dev: usb.core.Device, entry: ControlEntry) -> None:
+    details = [f"info=0x{entry.info:02x}"]
+    if entry.minimum is not None:
+        details.append(f"min={entry.minimum}")
+    if entry.maximum is not None:
+        details.append(f"max={entry.maximum}")
+    if entry.step is not None:
+        details.append(f"step={entry.step}")
+    if entry.default is not None:
+        details.append(f"def={entry.default}")
+
+    cur_raw = _fetch_control_value(dev, entry, GET_CUR, length_hint=entry.length)
+    if cur_raw is not None:
+        signed = entry.minimum is not None and entry.minimum < 0
+        formatted = _format_value("cur", cur_raw, signed=signed)
+        if formatted:
+            details.append(formatted)
+    print(
+        f"    Unit {entry.unit_id} ({entry.type}) selector {entry.selector}: {entry.name}"
+    )
+    print(f"      ({', '.join(details)})")
 
 
 def print_streaming(
     dev: usb.core.Device,
     *,
     still_tests: Optional[dict] = None,
+    interfaces: Optional[Dict[int, StreamingInterface]] = None,
 ) -> None:
-    interfaces = list_streaming_interfaces(dev)
+    if interfaces is None:
+        interfaces = list_streaming_interfaces(dev)
     for interface in interfaces.values():
         print(f"  Interface {interface.interface_number}:")
         for fmt in interface.formats:
@@ -199,8 +206,14 @@ def print_streaming(
             )
 
 
-def run_probe(dev: usb.core.Device, args) -> None:
-    interfaces = list_streaming_interfaces(dev)
+def run_probe(
+    dev: usb.core.Device,
+    args,
+    *,
+    interfaces: Optional[Dict[int, StreamingInterface]] = None,
+) -> None:
+    if interfaces is None:
+        interfaces = list_streaming_interfaces(dev)
     info = interfaces.get(args.probe_interface)
     if info is None:
         print(f"Interface {args.probe_interface} is not a streaming interface")
@@ -226,13 +239,12 @@ def run_probe(dev: usb.core.Device, args) -> None:
     print(
         f"  Probe result: format {stream_format.description}, frame {frame.width}x{frame.height}"
     )
-    for key in sorted(result):
-        print(f"    {key}: {result[key]}")
+    for key, value in sorted(result.items()):
+        print(f"    {key}: {value}")
 
 
 def _payload_summary(frame: CapturedFrame) -> str:
-    head = frame.payload[:16]
-    return " ".join(f"{byte:02x}" for byte in head)
+    return frame.payload[:16].hex(" ")
 
 
 def _is_valid_payload(frame: CapturedFrame) -> bool:
@@ -242,21 +254,22 @@ def _is_valid_payload(frame: CapturedFrame) -> bool:
     if subtype == VS_FORMAT_MJPEG:
         return frame.payload.startswith(b"\xff\xd8")
     if subtype == VS_FORMAT_UNCOMPRESSED:
-        return any(frame.payload)
+        # count() scans in C; any() would box every byte of a multi-MB frame.
+        return frame.payload.count(0) != len(frame.payload)
     return True
 
 
+def _frame_area(frame) -> int:
+    return frame.width * frame.height
+
+
 def _still_combinations(interface: StreamingInterface) -> List[tuple]:
     combos: List[tuple] = []
 
-    def area(width: int, height: int) -> int:
-        return width * height
-
-    # Method 2 descriptors first (highest resolution to lowest)
+    # Method 2 descriptors first (largest still frame per format)
     for fmt in interface.formats:
-        ordered = sorted(fmt.still_frames, key=lambda frame: area(frame.width, frame.height), reverse=True)
-        if ordered:
-            still = ordered[0]
+        if fmt.still_frames:
+            still = max(fmt.still_frames, key=_frame_area)
             comps = still.compression_indices or [1]
             combos.append(("method2", fmt, still, comps))
 
@@ -264,7 +277,7 @@ def _still_combinations(interface: StreamingInterface) -> List[tuple]:
     for fmt in interface.formats:
         frames = [frame for frame in fmt.frames if frame.supports_still]
         if frames:
-            frame = max(frames, key=lambda item: area(item.width, item.height))
+            frame = max(frames, key=_frame_area)
             combos.append(("method1", fmt, frame, [1]))
 
     return combos
@@ -312,6 +325,11 @@ def test_still_capture(
                                 compression_index=comp,
                             )
                             setattr(camera, "_still_allow_fallback", False)
+                        except UVCError as exc:
+                            # The format/frame itself was rejected; other
+                            # compression indices cannot fix that.
+                            last_issue = f"{desc} configure failed: {exc}"
+                            break
                         except Exception as exc:
                             last_issue = f"{desc} configure failed: {exc}"
                             continue
@@ -363,6 +381,11 @@ def main() -> int:
     parser.add_argument("-v", "--verbose", action="store_true")
     parser.add_argument("--test-still", action="store_true", help="Attempt to capture a still frame for each VS interface")
     parser.add_argument("--list", action="store_true", help="Only list matching devices and exit")
+    parser.add_argument(
+        "--no-controls",
+        action="store_true",
+        help="Skip Video Control enumeration (avoids claiming the VC interface)",
+    )
     args = parser.parse_args()
 
     apply_device_filters(args)
@@ -409,17 +432,18 @@ def main() -> int:
             )
 
         print("\n--- Video Streaming (VS) Interfaces ---")
-        print_streaming(dev, still_tests=still_results)
+        print_streaming(dev, still_tests=still_results, interfaces=stream_map)
 
-        print("\n--- Video Control (VC) Interface & Controls ---")
-        try:
-            print_controls(dev)
-        except usb.core.USBError as exc:
-            print(f"  Unable to enumerate VC controls: {exc}")
+        if not args.no_controls:
+            print("\n--- Video Control (VC) Interface & Controls ---")
+            try:
+                print_controls(dev)
+            except usb.core.USBError as exc:
+                print(f"  Unable to enumerate VC controls: {exc}")
 
         if args.probe_interface is not None:
             print("\n--- Probe/Commit Test ---")
-            run_probe(dev, args)
+            run_probe(dev, args, interfaces=stream_map)
 
         print("\n" + "=" * 70)
 
@@ -22,6 +22,7 @@ except ImportError:  # pragma: no cover - editable install fallback
 
 
 LOG = logging.getLogger("ir_torch_demo")
+_poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
 
 
 def _cycle_led(camera: UVCCamera, control_names: List[str], stop_event: threading.Event) -> None:
@@ -127,16 +128,17 @@ def main() -> int:
                         worker.join(timeout=1)
                     return 1
 
+                bgr = None
                 try:
                     for frame in frames:
                         try:
-                            bgr = frame.to_bgr()
+                            bgr = frame.to_bgr(out=bgr)
                         except RuntimeError as exc:
                             LOG.warning("Frame conversion failed: %s", exc)
                             continue
 
                         cv2.imshow("IR Preview", bgr)
-                        key = cv2.waitKey(1) & 0xFF
+                        key = _poll_key() & 0xFF
                         if key in (ord("q"), 27):
                             break
                         if args.duration and (time.time() - start) >= args.duration:
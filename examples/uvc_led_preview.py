@@ -21,6 +21,7 @@ except ImportError:  # pragma: no cover
     from libusb_uvc import CodecPreference, UVCCamera, UVCError, describe_device
 
 LOG = logging.getLogger("led_preview")
+_poll_key = getattr(cv2, "pollKey", None) or (lambda: cv2.waitKey(1))
 
 
 def _disable_led(camera: UVCCamera, control_names: list[str]) -> None:
@@ -84,16 +85,18 @@ def main() -> int:
                 start = time.time()
                 window = "LED Preview"
                 cv2.namedWindow(window, cv2.WINDOW_NORMAL)
+                bgr = None
                 try:
                     for frame in frames:
                         try:
-                            bgr = frame.to_bgr()
+                            # imshow copies synchronously, so the buffer can be reused.
+                            bgr = frame.to_bgr(out=bgr)
                         except RuntimeError as exc:
                             LOG.warning("Failed to decode frame: %s", exc)
                             continue
 
                         cv2.imshow(window, bgr)
-                        key = cv2.waitKey(1) & 0xFF
+                        key = _poll_key() & 0xFF
                         if key in (ord("q"), 27):
                             break
                         if args.duration and (time.time() - start) >= args.duration:
@@ -19,6 +19,7 @@ import pathlib
 import queue
 import threading
 import time
+import weakref
 from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import usb.core
@@ -528,13 +529,29 @@ class CapturedFrame:
                 self._rgb_cache = decode_to_rgb(self.payload, self.format, self.frame)
         return self._rgb_cache
 
-    def to_bgr(self):
+    def to_bgr(self, out=None):
+        """Return the frame as BGR, writing into *out* when its shape and dtype match.
+
+        Passing the previous result back as *out* lets preview loops reuse one
+        buffer instead of allocating a new image per frame.
+        """
+
         try:
             import cv2
         except ImportError as exc:
             raise RuntimeError("OpenCV is required for BGR conversion") from exc
+        if self._rgb_cache is None and self.decoded is None and _is_yuy2_frame(
+            len(self.payload), self.format, self.frame
+        ):
+            import numpy as _np
+
+            # One cvtColor pass replaces the numpy YUY2->RGB path plus RGB->BGR.
+            packed = _np.frombuffer(self.payload, dtype=_np.uint8).reshape(
+                (self.frame.height, self.frame.width, 2)
+            )
+            return cv2.cvtColor(packed, cv2.COLOR_YUV2BGR_YUY2, dst=out)
         rgb = self.to_rgb()
-        return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+        return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=out)
 
 
 @dataclasses.dataclass
@@ -602,7 +619,8 @@ class FrameReassembler:
         fid = flags & BH_FID
         eof = bool(flags & BH_EOF)
         err = bool(flags & BH_ERR)
-        payload = packet[header_len:]
+        # A view avoids copying every packet's payload before it is appended.
+        payload = memoryview(packet)[header_len:]
 
         if self._current_fid is None:
             self._start_frame(fid, err)
@@ -1090,21 +1108,36 @@ def _parse_still_frame_descriptor(
     return frames
 
 
+# String descriptors per Device object; a re-enumerated device gets a new entry.
+_STRING_CACHE: "weakref.WeakKeyDictionary[usb.core.Device, Dict[int, Optional[str]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_device_string(dev: usb.core.Device, index: int) -> Optional[str]:
+    """Return string descriptor *index* of *dev*, or ``None`` when unavailable.
+
+    Each lookup costs a GET_DESCRIPTOR control transfer, so results are
+    cached for the lifetime of the :class:`usb.core.Device` object.
+    """
+
+    if not index:
+        return None
+    strings = _STRING_CACHE.setdefault(dev, {})
+    if index not in strings:
+        try:
+            strings[index] = usb.util.get_string(dev, index)
+        except (ValueError, usb.core.USBError):
+            strings[index] = None
+    return strings[index]
+
+
 def describe_device(dev: usb.core.Device) -> str:
     """Human readable summary of vendor/product/serial info."""
 
-    try:
-        vendor = usb.util.get_string(dev, dev.iManufacturer)
-    except (ValueError, usb.core.USBError):
-        vendor = None
-    try:
-        product = usb.util.get_string(dev, dev.iProduct)
-    except (ValueError, usb.core.USBError):
-        product = None
-    try:
-        serial = usb.util.get_string(dev, dev.iSerialNumber)
-    except (ValueError, usb.core.USBError):
-        serial = None
+    vendor = get_device_string(dev, dev.iManufacturer)
+    product = get_device_string(dev, dev.iProduct)
+    serial = get_device_string(dev, dev.iSerialNumber)
 
     vendor = vendor or f"VID_{dev.idVendor:04x}"
     product = product or f"PID_{dev.idProduct:04x}"
@@ -1966,11 +1999,12 @@ class UVCCamera:
         *,
         interface_hint: Optional[int] = None,
     ) -> ControlEntry:
-        self.enumerate_controls()
-
         if isinstance(key, ControlEntry):
             return key
 
+        if not self._control_cache:
+            self._refresh_control_cache()
+
         if isinstance(key, UVCControl):
             key = (interface_hint or self._control_interface or 0, key.unit_id, key.selector)
 
@@ -3757,7 +3791,9 @@ class FrameStream:
             )
             return
 
-        payload_data = bytes(result.payload)
+        # The reassembler starts a fresh buffer for every frame, so the completed
+        # one can be handed over as-is instead of being copied into ``bytes``.
+        payload_data = result.payload
         payload_for_record = payload_data
         if self._recorder is not None:
             if self._format.subtype == VS_FORMAT_MJPEG:
@@ -3894,8 +3930,12 @@ def gray16_to_rgb(payload: bytes, width: int, height: int):
     return np.repeat(gray8[:, :, None], 3, axis=2)
 
 
-def _trim_mjpeg_payload(payload: bytes) -> bytes:
-    """Return payload truncated at the JPEG EOI marker if trailing garbage is present."""
+def _trim_mjpeg_payload(payload: bytes) -> Union[bytes, memoryview]:
+    """Return payload truncated at the JPEG EOI marker if trailing garbage is present.
+
+    The truncated result is a :class:`memoryview` over *payload* rather than a
+    copy of the whole JPEG.
+    """
 
     if not payload:
         return payload
@@ -3904,7 +3944,7 @@ def _trim_mjpeg_payload(payload: bytes) -> bytes:
         return payload
     if eoi + 2 == len(payload):
         return payload
-    trimmed = payload[: eoi + 2]
+    trimmed = memoryview(payload)[: eoi + 2]
     LOG.debug("Trimming MJPEG payload from %s to %s bytes (extraneous %s bytes)", len(payload), len(trimmed), len(payload) - len(trimmed))
     return trimmed
 
@@ -3947,6 +3987,15 @@ def _strip_mjpeg_app_markers(payload: bytes) -> bytes:
         offset = segment_end
     return bytes(out)
 
+def _is_yuy2_frame(payload_len: int, stream_format: StreamFormat, frame: FrameInfo) -> bool:
+    """Return ``True`` when :func:`decode_to_rgb` would treat the payload as packed YUY2."""
+
+    if stream_format.subtype != VS_FORMAT_UNCOMPRESSED or frame.width % 2:
+        return False
+    name = stream_format.description.upper()
+    return payload_len == frame.width * frame.height * 2 and ("YUY" in name or "YUV" in name)
+
+
 def decode_to_rgb(payload: bytes, stream_format: StreamFormat, frame: FrameInfo):
     """Convert a raw payload into an RGB image (numpy array).
 
@@ -3980,10 +4029,15 @@ def decode_to_rgb(payload: bytes, stream_format: StreamFormat, frame: FrameInfo)
 
         cleaned = _trim_mjpeg_payload(payload)
         arr = np.frombuffer(cleaned, dtype=np.uint8)
-        bgr = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-        if bgr is None:
+        # libjpeg-turbo can emit RGB directly when OpenCV exposes the flag.
+        rgb_flag = getattr(cv2, "IMREAD_COLOR_RGB", None)
+        if rgb_flag is not None:
+            rgb = cv2.imdecode(arr, rgb_flag)
+        else:
+            bgr = cv2.imdecode(arr, cv2.IMREAD_COLOR)
+            rgb = None if bgr is None else cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+        if rgb is None:
             raise RuntimeError("Failed to decode MJPEG frame (corrupt or unsupported payload)")
-        rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
         return rgb
 
     raise RuntimeError(f"Unsupported codec for conversion: {stream_format.description}")
@@ -4059,18 +4113,23 @@ def _vc_w_value(selector: int) -> int:
     return (selector & 0xFF) << 8
 
 
-@contextlib.contextmanager
-def claim_vc_interface(
-    dev: usb.core.Device,
-    vc_if: int,
-    *,
-    auto_reattach: bool = True,
-    auto_detach: Optional[bool] = None,
-):
-    """Detach only the VC interface from the kernel, claim it, then release and reattach."""
-    reattach = False
-    detach = _auto_detach_vc_enabled() if auto_detach is None else bool(auto_detach)
+@dataclasses.dataclass
+class _VcClaim:
+    depth: int
+    reattach: bool
+
+
+# Active VC claims by (id(dev), interface), shared by every thread.  The lock
+# is held while claiming and releasing so the first entry and the last exit
+# see a consistent depth.
+_VC_CLAIMS: Dict[Tuple[int, int], _VcClaim] = {}
+_VC_CLAIMS_LOCK = threading.Lock()
+
 
+def _acquire_vc_interface(dev: usb.core.Device, vc_if: int, detach: bool) -> bool:
+    """Claim *vc_if*, returning ``True`` when the kernel driver was detached."""
+
+    reattach = False
     try:
         dev.set_configuration()
     except usb.core.USBError:
@@ -4102,14 +4161,43 @@ def claim_vc_interface(
         raise RuntimeError(
             "VC interface is busy. Detach the kernel driver or enable auto-detach."
         ) from exc
+    return reattach
+
+
+@contextlib.contextmanager
+def claim_vc_interface(
+    dev: usb.core.Device,
+    vc_if: int,
+    *,
+    auto_reattach: bool = True,
+    auto_detach: Optional[bool] = None,
+):
+    """Detach only the VC interface from the kernel, claim it, then release and reattach.
+
+    Claims are reference counted per device and interface, across threads:
+    only the first entry claims and only the exit that drops the count to zero
+    releases the interface and hands it back to the kernel driver.
+    """
+    key = (id(dev), vc_if)
+    with _VC_CLAIMS_LOCK:
+        claim = _VC_CLAIMS.get(key)
+        if claim is None:
+            detach = _auto_detach_vc_enabled() if auto_detach is None else bool(auto_detach)
+            reattach = _acquire_vc_interface(dev, vc_if, detach)
+            claim = _VC_CLAIMS[key] = _VcClaim(depth=0, reattach=auto_reattach and reattach)
+        claim.depth += 1
     try:
         yield
     finally:
-        with contextlib.suppress(usb.core.USBError):
-            usb.util.release_interface(dev, vc_if)
-        if auto_reattach and reattach:
-            with contextlib.suppress(usb.core.USBError):
-                dev.attach_kernel_driver(vc_if)
+        with _VC_CLAIMS_LOCK:
+            claim.depth -= 1
+            if claim.depth == 0:
+                del _VC_CLAIMS[key]
+                with contextlib.suppress(usb.core.USBError):
+                    usb.util.release_interface(dev, vc_if)
+                if claim.reattach:
+                    with contextlib.suppress(usb.core.USBError):
+                        dev.attach_kernel_driver(vc_if)
 
 
 def vc_ctrl_get(dev: usb.core.Device, vc_if: int, unit_id: int, selector: int, request: int, length: int):
@@ -4482,6 +4570,7 @@ __all__ = [
     "DecoderPreference",
     "describe_device",
     "find_uvc_devices",
+    "get_device_string",
     "iter_video_streaming_interfaces",
     "list_streaming_interfaces",
     "list_control_units",
@@ -9,7 +9,7 @@ import queue
 import threading
 import time
 from collections import deque
-from typing import Deque, Iterator, Optional, Tuple
+from typing import Deque, Iterator, NamedTuple, Optional, Tuple
 
 import usb.util
 
@@ -73,8 +73,7 @@ class StereoStats:
     last_delta_ms: Optional[float] = None
 
 
-@dataclasses.dataclass
-class _StampedFrame:
+class _StampedFrame(NamedTuple):
     frame: CapturedFrame
     timestamp: float
 
@@ -164,6 +163,9 @@ class StereoCapture:
         self._output_queue: "queue.Queue[Optional[StereoFrame]]" = queue.Queue(maxsize=left.queue_size + right.queue_size)
         self._stats = StereoStats()
         self._stop_event = threading.Event()
+        # Set by either camera thread after a push so the collector sleeps until
+        # whichever side has data instead of polling both deques.
+        self._frames_ready = threading.Event()
         self._threads: list[threading.Thread] = []
         self._contexts: list[object] = []
         self._closed = False
@@ -196,6 +198,7 @@ class StereoCapture:
         if self._closed:
             return
         self._stop_event.set()
+        self._frames_ready.set()
         for thread in self._threads:
             thread.join(timeout=1.0)
         for ctx in reversed(self._contexts):
@@ -266,8 +269,12 @@ class StereoCapture:
 
         self._contexts = contexts
 
-        self._left_queue: "queue.Queue[Optional[CapturedFrame]]" = queue.Queue(maxsize=self._left_cfg.queue_size * 2)
-        self._right_queue: "queue.Queue[Optional[CapturedFrame]]" = queue.Queue(maxsize=self._right_cfg.queue_size * 2)
+        # Each deque has exactly one producer (the camera thread) and one consumer
+        # (the collector).  append/popleft are atomic, so no lock is taken per
+        # frame; when the collector falls behind the oldest frame is evicted,
+        # matching the drop-oldest policy of FrameStream itself.
+        self._left_queue: Deque[Optional[CapturedFrame]] = deque(maxlen=self._left_cfg.queue_size * 2)
+        self._right_queue: Deque[Optional[CapturedFrame]] = deque(maxlen=self._right_cfg.queue_size * 2)
 
         self._launch_consumer(left_stream, self._left_queue, "left")
         self._launch_consumer(right_stream, self._right_queue, "right")
@@ -276,17 +283,26 @@ class StereoCapture:
         collector.start()
         self._threads.append(collector)
 
-    def _launch_consumer(self, frames: Iterator[CapturedFrame], target: queue.Queue, label: str) -> None:
+    def _launch_consumer(
+        self,
+        frames: Iterator[CapturedFrame],
+        target: Deque[Optional[CapturedFrame]],
+        label: str,
+    ) -> None:
         def _run():
+            push = target.append
+            notify = self._frames_ready.set
             try:
                 for frame in frames:
                     if self._stop_event.is_set():
                         break
-                    target.put(frame)
+                    push(frame)
+                    notify()
             except Exception:
                 LOG.debug("Stereo %s consumer failed", label, exc_info=True)
             finally:
-                target.put(None)
+                push(None)
+                notify()
 
         thread = threading.Thread(target=_run, name=f"uvc-stereo-{label}", daemon=True)
         thread.start()
@@ -332,13 +348,16 @@ class StereoCapture:
 
             if left_done and right_done and not left_buffer and not right_buffer:
                 break
-            time.sleep(0.001)
+            self._frames_ready.clear()
+            # Re-check after clearing so a push racing with clear() is not missed.
+            if not self._left_queue and not self._right_queue:
+                self._frames_ready.wait(timeout=0.1)
 
         self._output_queue.put(None)
 
     def _drain_queue(
         self,
-        source: "queue.Queue[Optional[CapturedFrame]]",
+        source: Deque[Optional[CapturedFrame]],
         buffer: Deque[_StampedFrame],
         unwrapper: _PtsUnwrapper,
         wall_start: float,
@@ -347,16 +366,15 @@ class StereoCapture:
     ) -> Tuple[bool, Optional[float]]:
         if done:
             return True, last_seen
-        while True:
-            try:
-                frame = source.get_nowait()
-            except queue.Empty:
-                break
+        # Only this thread pops, and a concurrent append never empties the deque,
+        # so popleft() cannot fail once the emptiness check has passed.
+        while source:
+            frame = source.popleft()
             if frame is None:
                 return True, last_seen
             host_ts = frame.timestamp - wall_start
             timestamp = unwrapper.convert(frame, host_ts, self._prefer_hw_pts)
-            buffer.append(_StampedFrame(frame=frame, timestamp=timestamp))
+            buffer.append(_StampedFrame(frame, timestamp))
             last_seen = timestamp
         return False, last_seen
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 import pytest
@@ -7,6 +8,9 @@ import pytest
 from libusb_uvc import (
     GET_CUR,
     UVCControlsManager,
+    claim_vc_interface,
+    describe_device,
+    get_device_string,
     vc_ctrl_get,
     vc_ctrl_set,
 )
@@ -74,3 +78,98 @@ def test_get_and_set_control(controls_manager: UVCControlsManager, emulator: Uvc
     )
     assert int.from_bytes(raw, "little") == 150
     assert emulator.get_control_value(2, 1) == 150
+
+
+def test_device_strings_are_read_once_per_device(monkeypatch):
+    import usb.util
+
+    class FakeDevice:
+        idVendor = 0x1234
+        idProduct = 0x5678
+        iManufacturer = 1
+        iProduct = 2
+        iSerialNumber = 3
+
+    reads = []
+
+    def fake_get_string(dev, index):
+        reads.append(index)
+        return {1: "Acme", 2: "Cam", 3: "SN42"}[index]
+
+    monkeypatch.setattr(usb.util, "get_string", fake_get_string)
+    dev = FakeDevice()
+
+    assert describe_device(dev) == "Acme Cam (S/N SN42)"
+    assert get_device_string(dev, dev.iSerialNumber) == "SN42"
+    assert get_device_string(dev, 0) is None
+    assert sorted(reads) == [1, 2, 3]
+
+
+class _FakeVcDevice:
+    """Minimal device recording the claim/detach calls made by claim_vc_interface."""
+
+    def __init__(self, calls):
+        self.calls = calls
+        self._driver_active = True
+
+    def set_configuration(self):
+        pass
+
+    def is_kernel_driver_active(self, interface):
+        return self._driver_active
+
+    def detach_kernel_driver(self, interface):
+        self._driver_active = False
+        self.calls.append(("detach", interface))
+
+    def attach_kernel_driver(self, interface):
+        self._driver_active = True
+        self.calls.append(("attach", interface))
+
+
+@pytest.fixture()
+def vc_calls(monkeypatch):
+    import usb.util
+
+    calls = []
+    monkeypatch.setattr(usb.util, "claim_interface", lambda dev, intf: calls.append(("claim", intf)))
+    monkeypatch.setattr(usb.util, "release_interface", lambda dev, intf: calls.append(("release", intf)))
+    return calls
+
+
+def test_nested_vc_claim_releases_once(vc_calls):
+    dev = _FakeVcDevice(vc_calls)
+
+    with claim_vc_interface(dev, 0):
+        with claim_vc_interface(dev, 0):
+            pass
+        assert vc_calls == [("detach", 0), ("claim", 0)]
+    assert vc_calls == [("detach", 0), ("claim", 0), ("release", 0), ("attach", 0)]
+
+
+def test_vc_claim_shared_across_threads_releases_on_last_exit(vc_calls):
+    dev = _FakeVcDevice(vc_calls)
+    entered = threading.Event()
+    leave = threading.Event()
+    errors = []
+
+    def other_thread():
+        try:
+            with claim_vc_interface(dev, 0):
+                entered.set()
+                assert leave.wait(timeout=5.0)
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    with claim_vc_interface(dev, 0):
+        worker = threading.Thread(target=other_thread)
+        worker.start()
+        assert entered.wait(timeout=5.0)
+
+    # The first claimant has left, but the other thread still owns the claim.
+    assert vc_calls == [("detach", 0), ("claim", 0)]
+
+    leave.set()
+    worker.join(timeout=5.0)
+    assert not errors
+    assert vc_calls == [("detach", 0), ("claim", 0), ("release", 0), ("attach", 0)]
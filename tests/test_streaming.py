@@ -7,8 +7,19 @@ from pathlib import Path
 
 import pytest
 
-from libusb_uvc import CodecPreference, UVCCamera, UVCError, StreamFormat, FrameInfo
-from libusb_uvc.core import FrameStream, FrameAssemblyResult, _strip_mjpeg_app_markers
+from libusb_uvc import (
+    CapturedFrame,
+    CodecPreference,
+    UVCCamera,
+    UVCError,
+    StreamFormat,
+    FrameInfo,
+    VS_FORMAT_MJPEG,
+    VS_FORMAT_UNCOMPRESSED,
+    decode_to_rgb,
+    yuy2_to_rgb,
+)
+from libusb_uvc.core import FrameStream, FrameAssemblyResult, _strip_mjpeg_app_markers, _trim_mjpeg_payload
 from libusb_uvc.decoders import RecorderBackend
 from libusb_uvc.core import FrameAssemblyResult, FrameStream
 
@@ -190,3 +201,107 @@ def test_frame_stream_reports_stats(camera: UVCCamera):
     assert stats.frames_completed == 1
     assert stats.bytes_delivered == 128
     assert stats.last_frame_duration_s == 0.01
+
+
+def test_frame_stream_hands_over_reassembled_payload(camera: UVCCamera):
+    fmt, frame = camera.interface.formats[0], camera.interface.formats[0].frames[0]
+    stream = FrameStream(
+        camera=camera,
+        stream_format=fmt,
+        frame=frame,
+        frame_rate=None,
+        strict_fps=False,
+        queue_size=1,
+        skip_initial=0,
+        transfers=1,
+        packets_per_transfer=1,
+        timeout_ms=1000,
+        duration=None,
+        decoder_preference=None,
+    )
+    stream._active = True  # type: ignore[attr-defined]
+    payload = bytearray(b"\xff\xd8\x00\x00\xff\xd9")
+    result = FrameAssemblyResult(
+        payload=payload,
+        fid=0,
+        pts=None,
+        reason="eof",
+        error=False,
+        duration=None,
+    )
+    stream._handle_frame_result(result)
+    captured = stream._queue.get_nowait()  # type: ignore[attr-defined]
+    assert captured.payload is payload
+
+
+def test_yuy2_to_bgr_matches_numpy_conversion():
+    cv2 = pytest.importorskip("cv2")
+    np = pytest.importorskip("numpy")
+    width, height = 16, 8
+    frame = FrameInfo(
+        frame_index=1,
+        width=width,
+        height=height,
+        default_interval=333333,
+        intervals_100ns=[333333],
+        max_frame_size=width * height * 2,
+    )
+    fmt = StreamFormat(
+        description="YUY2",
+        format_index=1,
+        subtype=VS_FORMAT_UNCOMPRESSED,
+        guid=b"\x00" * 16,
+        frames=[frame],
+    )
+    payload = bytes(np.random.default_rng(0).integers(0, 256, width * height * 2, dtype=np.uint8))
+    captured = CapturedFrame(payload=payload, format=fmt, frame=frame, fid=0, pts=None)
+
+    out = np.empty((height, width, 3), dtype=np.uint8)
+    bgr = captured.to_bgr(out=out)
+    expected = cv2.cvtColor(yuy2_to_rgb(payload, width, height), cv2.COLOR_RGB2BGR)
+
+    assert bgr is out
+    assert np.abs(bgr.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_trim_mjpeg_payload_views_original_buffer():
+    payload = bytearray(b"\xff\xd8jpeg-body\xff\xd9\x00\x00\x00")
+    trimmed = _trim_mjpeg_payload(payload)
+
+    assert bytes(trimmed) == b"\xff\xd8jpeg-body\xff\xd9"
+    payload[2] = ord("J")
+    assert bytes(trimmed[2:3]) == b"J"
+
+    clean = b"\xff\xd8body\xff\xd9"
+    assert _trim_mjpeg_payload(clean) is clean
+
+
+def test_mjpeg_decode_to_rgb_channel_order():
+    cv2 = pytest.importorskip("cv2")
+    np = pytest.importorskip("numpy")
+    width, height = 16, 8
+    frame = FrameInfo(
+        frame_index=1,
+        width=width,
+        height=height,
+        default_interval=333333,
+        intervals_100ns=[333333],
+        max_frame_size=width * height * 3,
+    )
+    fmt = StreamFormat(
+        description="MJPEG",
+        format_index=1,
+        subtype=VS_FORMAT_MJPEG,
+        guid=b"\x00" * 16,
+        frames=[frame],
+    )
+    bgr = np.zeros((height, width, 3), dtype=np.uint8)
+    bgr[..., 2] = 255  # pure red
+    ok, encoded = cv2.imencode(".jpg", bgr, [cv2.IMWRITE_JPEG_QUALITY, 100])
+    assert ok
+
+    rgb = decode_to_rgb(encoded.tobytes() + b"\x00\x00", fmt, frame)
+
+    assert rgb.shape == (height, width, 3)
+    assert rgb[..., 0].min() > 240
+    assert rgb[..., 2].max() < 15